@@ -81,6 +81,9 @@ class ConversionResult:
     validation_issues: list[str] = field(default_factory=list)
     """List of SVG validation issues found."""
 
+    fast_path: bool = False
+    """Whether the input had no text elements and conversion was skipped."""
+
 
 class Text2PathConverter:
     """Main converter class for SVG text-to-path conversion.
@@ -215,8 +218,16 @@ class Text2PathConverter:
                 f"Failed to parse SVG: {e}", source=str(input_path)
             ) from e
 
-        # Convert
-        result = self._convert_tree(tree, input_format="file")
+        # A document without text elements needs no conversion: skip the
+        # textPath scan and conversion loop, but write the parsed tree below
+        # like any other output
+        root = tree.getroot()
+        if root is not None and not self._collect_text_with_parents(root):
+            result = ConversionResult(
+                success=True, input_format="file", output=None, fast_path=True
+            )
+        else:
+            result = self._convert_tree(tree, input_format="file")
 
         # Write output
         if result.success or result.path_count > 0:
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, ClassVar
 
 from .validation import (
     _is_remote_path,
@@ -40,6 +39,24 @@ class FormatSelection:
     plaintext: bool = False  # .txt files (data URIs)
     epub: bool = False  # .epub ebook files
 
+    # Field names, precomputed so validation never calls dataclasses.fields()
+    _FIELD_NAMES: ClassVar[frozenset[str]] = frozenset(
+        {
+            "svg",
+            "svgz",
+            "html",
+            "css",
+            "json",
+            "csv",
+            "markdown",
+            "python",
+            "javascript",
+            "rst",
+            "plaintext",
+            "epub",
+        }
+    )
+
 
 # Map format flags to file extensions
 FORMAT_EXTENSIONS: dict[str, list[str]] = {
@@ -58,6 +75,27 @@ FORMAT_EXTENSIONS: dict[str, list[str]] = {
 }
 
 
+# Type validators for each settings field: (accepted types, name for errors).
+# Its keys are the fields settable from YAML (BatchSettings._FIELD_NAMES).
+_SETTINGS_VALIDATORS: dict[str, tuple[type | tuple[type, ...], str]] = {
+    "precision": (int, "integer"),
+    "preserve_styles": (bool, "boolean"),
+    "system_fonts_only": (bool, "boolean"),
+    "font_dirs": (list, "list"),
+    "no_remote_fonts": (bool, "boolean"),
+    "no_size_limit": (bool, "boolean"),
+    "auto_download": (bool, "boolean"),
+    "validate": (bool, "boolean"),
+    "verify": (bool, "boolean"),
+    "verify_pixel_threshold": (int, "integer"),
+    "verify_image_threshold": ((int, float), "number"),
+    "jobs": (int, "integer"),
+    "continue_on_error": (bool, "boolean"),
+    "allow_overwrite": (bool, "boolean"),
+    "preflight_check": (bool, "boolean"),
+}
+
+
 @dataclass
 class BatchSettings:
     """Settings that apply to all conversions in the batch."""
@@ -79,6 +117,9 @@ class BatchSettings:
     preflight_check: bool = True  # Check path accessibility before processing
     formats: FormatSelection = field(default_factory=FormatSelection)
 
+    # Fields settable from the YAML settings section (formats has its own)
+    _FIELD_NAMES: ClassVar[frozenset[str]] = frozenset(_SETTINGS_VALIDATORS)
+
 
 @dataclass
 class InputEntry:
@@ -124,28 +165,22 @@ class BatchConfigError(ValueError):
     pass
 
 
-def _validate_formats(formats_data: dict[str, Any]) -> list[str]:
-    """Validate formats section and return list of errors."""
-    errors: list[str] = []
-
-    valid_formats = {
-        "svg",
-        "svgz",
-        "html",
-        "css",
-        "json",
-        "csv",
-        "markdown",
-        "python",
-        "javascript",
-        "rst",
-        "plaintext",
-        "epub",
-    }
+def _validate_formats(
+    formats_data: dict[str, Any], errors: list[str]
+) -> FormatSelection:
+    """Validate formats section and build the FormatSelection.
+
+    Errors are appended to ``errors``. An empty or invalid section yields the
+    default selection (svg only); callers raise on any recorded error.
+    """
+    if not formats_data:
+        return FormatSelection()
+
+    error_count = len(errors)
 
     for key, value in formats_data.items():
-        if key not in valid_formats:
-            valid_list = ", ".join(sorted(valid_formats))
+        if key not in FormatSelection._FIELD_NAMES:
+            valid_list = ", ".join(sorted(FormatSelection._FIELD_NAMES))
             errors.append(f"formats.{key}: unknown format (valid: {valid_list})")
             continue
         # Allow int for bool (YAML parses 1/0 as ints)
@@ -155,46 +190,39 @@ def _validate_formats(formats_data: dict[str, Any]) -> list[str]:
             )
 
     # Check that at least one format is enabled
-    any_enabled = any(bool(formats_data.get(fmt, False)) for fmt in valid_formats)
+    any_enabled = any(
+        bool(formats_data.get(fmt, False)) for fmt in FormatSelection._FIELD_NAMES
+    )
     if not any_enabled:
         errors.append("formats: at least one format must be enabled (set to true)")
 
-    return errors
+    if len(errors) > error_count:
+        return FormatSelection()
+
+    # All keys are known and boolean-like, so the generated __init__ can bind
+    # them directly; missing formats keep their defaults (svg on, others off)
+    return FormatSelection(**{key: bool(value) for key, value in formats_data.items()})
 
 
-def _validate_settings(settings_data: dict[str, Any]) -> list[str]:
-    """Validate settings section and return list of errors.
+def _validate_settings(
+    settings_data: dict[str, Any], errors: list[str]
+) -> BatchSettings:
+    """Validate settings section and build the BatchSettings.
 
-    Validates types, value ranges, and semantic constraints.
+    Validates types, value ranges, and semantic constraints. Errors are
+    appended to ``errors``; an invalid section yields the default settings
+    and callers raise on any recorded error. The formats field is left at
+    its default; the caller fills it in.
     """
-    errors: list[str] = []
-
-    # Type validators for each field
-    validators: dict[str, tuple[type | tuple[type, ...], str]] = {
-        "precision": (int, "integer"),
-        "preserve_styles": (bool, "boolean"),
-        "system_fonts_only": (bool, "boolean"),
-        "font_dirs": (list, "list"),
-        "no_remote_fonts": (bool, "boolean"),
-        "no_size_limit": (bool, "boolean"),
-        "auto_download": (bool, "boolean"),
-        "validate": (bool, "boolean"),
-        "verify": (bool, "boolean"),
-        "verify_pixel_threshold": (int, "integer"),
-        "verify_image_threshold": ((int, float), "number"),
-        "jobs": (int, "integer"),
-        "continue_on_error": (bool, "boolean"),
-        "allow_overwrite": (bool, "boolean"),
-        "preflight_check": (bool, "boolean"),
-    }
+    error_count = len(errors)
 
     # Validate types
     for key, value in settings_data.items():
-        if key not in validators:
+        if key not in BatchSettings._FIELD_NAMES:
             errors.append(f"settings.{key}: unknown setting (will be ignored)")
             continue
 
-        expected_type, type_name = validators[key]
+        expected_type, type_name = _SETTINGS_VALIDATORS[key]
         if not isinstance(value, expected_type):
             # Handle special case: YAML parses 1/0 as ints, allow for bools
             if expected_type is bool and isinstance(value, int):
@@ -237,22 +265,36 @@ def _validate_settings(settings_data: dict[str, Any]) -> list[str]:
                         f"got {type(d).__name__}"
                     )
 
-    return errors
+    if len(errors) > error_count:
+        return BatchSettings()
+
+    # Every key is a known field with a valid type, so the values can be passed
+    # straight to the generated __init__; missing fields keep their defaults.
+    # Booleans may arrive as YAML 1/0 ints and are normalized here.
+    kwargs = {
+        key: bool(value) if _SETTINGS_VALIDATORS[key][0] is bool else value
+        for key, value in settings_data.items()
+    }
+    if "verify_image_threshold" in kwargs:
+        kwargs["verify_image_threshold"] = float(kwargs["verify_image_threshold"])
+    return BatchSettings(**kwargs)
 
 
 def _validate_input_entry(
-    i: int, entry: dict[str, Any] | str, allow_overwrite: bool = False
-) -> tuple[list[str], dict[str, Any] | None]:
-    """Validate a single input entry and return (errors, parsed_entry).
+    i: int,
+    entry: dict[str, Any] | str,
+    errors: list[str],
+    allow_overwrite: bool = False,
+) -> InputEntry | None:
+    """Validate a single input entry and build the InputEntry.
 
     Entry can be:
         - dict: Legacy format with path, output/output_dir, suffix fields
         - str: Compact format "input;output" or "input/;output/;suffix"
 
-    Returns:
-        Tuple of (list of error messages, parsed dict or None if errors)
+    Errors are appended to ``errors``. Returns None if the entry is invalid.
     """
-    errors: list[str] = []
+    error_count = len(errors)
 
     # Handle string format (compact semicolon-delimited)
     if isinstance(entry, str):
@@ -260,19 +302,19 @@ def _validate_input_entry(
             entry = _parse_compact_entry(entry)
         except ValueError as e:
             errors.append(f"inputs[{i}]: {e}")
-            return errors, None
+            return None
 
     # Check required path field
     if "path" not in entry:
         errors.append(f"inputs[{i}]: missing required 'path' field")
-        return errors, None
+        return None
 
     path_value = entry["path"]
     if not isinstance(path_value, str):
         errors.append(
             f"inputs[{i}].path: expected string, got {type(path_value).__name__}"
         )
-        return errors, None
+        return None
 
     # Validate input path format
     path_errors = _validate_path_format(path_value)
@@ -360,7 +402,32 @@ def _validate_input_entry(
                 "(use 'output' for explicit output path)"
             )
 
-    return errors, entry if not errors else None
+    if len(errors) > error_count:
+        return None
+
+    input_path = path_value if is_remote_input else Path(path_value)
+
+    if is_folder:
+        output_str = entry["output_dir"]
+        is_remote_output = _is_remote_path(output_str)
+        return InputEntry(
+            path=input_path,
+            is_folder=True,
+            is_remote_input=is_remote_input,
+            is_remote_output=is_remote_output,
+            output_dir=output_str if is_remote_output else Path(output_str),
+            suffix=entry.get("suffix", "_text2path"),
+        )
+
+    output_str = entry["output"]
+    is_remote_output = _is_remote_path(output_str)
+    return InputEntry(
+        path=input_path,
+        is_folder=False,
+        is_remote_input=is_remote_input,
+        is_remote_output=is_remote_output,
+        output=output_str if is_remote_output else Path(output_str),
+    )
 
 
 def load_batch_config(config_path: Path) -> BatchConfig:
@@ -372,6 +439,9 @@ def load_batch_config(config_path: Path) -> BatchConfig:
     - Required field validation for inputs
     - Mode-specific validation (folder vs file mode)
 
+    Each section is validated and built in a single pass, collecting all
+    errors before raising.
+
     Raises:
         BatchConfigError: If validation fails, with detailed error messages.
         FileNotFoundError: If config file doesn't exist.
@@ -381,12 +451,16 @@ def load_batch_config(config_path: Path) -> BatchConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    # Parse YAML
-    with open(config_path) as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise BatchConfigError(f"Invalid YAML syntax: {e}") from e
+    # Imported here so CLI subcommands that never load a batch config
+    # don't pay for PyYAML at startup
+    import yaml
+
+    # Parse YAML, preferring the libyaml-backed loader when available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        data = yaml.load(config_path.read_bytes(), Loader=loader)
+    except yaml.YAMLError as e:
+        raise BatchConfigError(f"Invalid YAML syntax: {e}") from e
 
     if not data:
         raise BatchConfigError("Empty YAML config file")
@@ -408,8 +482,7 @@ def load_batch_config(config_path: Path) -> BatchConfig:
             f"settings: expected mapping, got {type(settings_data).__name__}"
         )
         settings_data = {}
-    else:
-        all_errors.extend(_validate_settings(settings_data))
+    settings = _validate_settings(settings_data, all_errors)
 
     # Validate formats section (optional - defaults to svg only)
     formats_data = data.get("formats", {})
@@ -420,8 +493,7 @@ def load_batch_config(config_path: Path) -> BatchConfig:
             f"formats: expected mapping, got {type(formats_data).__name__}"
         )
         formats_data = {}
-    elif formats_data:  # Only validate if formats section provided
-        all_errors.extend(_validate_formats(formats_data))
+    format_selection = _validate_formats(formats_data, all_errors)
 
     # Get allow_overwrite early for input validation
     allow_overwrite = bool(settings_data.get("allow_overwrite", False))
@@ -437,18 +509,17 @@ def load_batch_config(config_path: Path) -> BatchConfig:
     elif len(inputs_data) == 0:
         all_errors.append("inputs: at least one input entry is required")
 
-    # Validate each input entry (supports both dict and string format)
-    validated_entries: list[dict[str, Any]] = []
+    # Validate and build each input entry (supports both dict and string format)
+    inputs: list[InputEntry] = []
     for i, entry in enumerate(inputs_data):
         if not isinstance(entry, (dict, str)):
             all_errors.append(
                 f"inputs[{i}]: expected string or mapping, got {type(entry).__name__}"
             )
             continue
-        errors, parsed = _validate_input_entry(i, entry, allow_overwrite)
-        all_errors.extend(errors)
-        if parsed is not None:
-            validated_entries.append(parsed)
+        input_entry = _validate_input_entry(i, entry, all_errors, allow_overwrite)
+        if input_entry is not None:
+            inputs.append(input_entry)
 
     # Validate log_file
     log_file_value = data.get("log_file")
@@ -464,85 +535,7 @@ def load_batch_config(config_path: Path) -> BatchConfig:
         )
         raise BatchConfigError(error_msg)
 
-    # Build format selection (svg defaults to True, others to False)
-    format_selection = FormatSelection(
-        svg=bool(formats_data.get("svg", True)),  # Default: enabled
-        svgz=bool(formats_data.get("svgz", False)),
-        html=bool(formats_data.get("html", False)),
-        css=bool(formats_data.get("css", False)),
-        json=bool(formats_data.get("json", False)),
-        csv=bool(formats_data.get("csv", False)),
-        markdown=bool(formats_data.get("markdown", False)),
-        python=bool(formats_data.get("python", False)),
-        javascript=bool(formats_data.get("javascript", False)),
-        rst=bool(formats_data.get("rst", False)),
-        plaintext=bool(formats_data.get("plaintext", False)),
-        epub=bool(formats_data.get("epub", False)),
-    )
-
-    # Build validated config objects
-    settings = BatchSettings(
-        precision=settings_data.get("precision", 6),
-        preserve_styles=bool(settings_data.get("preserve_styles", False)),
-        system_fonts_only=bool(settings_data.get("system_fonts_only", False)),
-        font_dirs=settings_data.get("font_dirs", []),
-        no_remote_fonts=bool(settings_data.get("no_remote_fonts", False)),
-        no_size_limit=bool(settings_data.get("no_size_limit", False)),
-        auto_download=bool(settings_data.get("auto_download", False)),
-        validate=bool(settings_data.get("validate", False)),
-        verify=bool(settings_data.get("verify", False)),
-        verify_pixel_threshold=settings_data.get("verify_pixel_threshold", 10),
-        verify_image_threshold=float(settings_data.get("verify_image_threshold", 5.0)),
-        jobs=settings_data.get("jobs", 4),
-        continue_on_error=bool(settings_data.get("continue_on_error", True)),
-        allow_overwrite=allow_overwrite,
-        preflight_check=bool(settings_data.get("preflight_check", True)),
-        formats=format_selection,
-    )
-
-    # Build input entries from validated entries
-    inputs: list[InputEntry] = []
-    for entry in validated_entries:
-        path_str = entry["path"]
-        is_remote_input = _is_remote_path(path_str)
-
-        # Determine if folder or file
-        if entry.get("_is_folder") is not None:
-            is_folder = entry["_is_folder"]
-        elif is_remote_input:
-            is_folder = path_str.endswith("/")
-        else:
-            path = Path(path_str)
-            if path.exists():
-                is_folder = path.is_dir()
-            else:
-                is_folder = path_str.endswith("/") or not path.suffix
-
-        if is_folder:
-            output_str = entry["output_dir"]
-            is_remote_output = _is_remote_path(output_str)
-            inputs.append(
-                InputEntry(
-                    path=path_str if is_remote_input else Path(path_str),
-                    is_folder=True,
-                    is_remote_input=is_remote_input,
-                    is_remote_output=is_remote_output,
-                    output_dir=output_str if is_remote_output else Path(output_str),
-                    suffix=entry.get("suffix", "_text2path"),
-                )
-            )
-        else:
-            output_str = entry["output"]
-            is_remote_output = _is_remote_path(output_str)
-            inputs.append(
-                InputEntry(
-                    path=path_str if is_remote_input else Path(path_str),
-                    is_folder=False,
-                    is_remote_input=is_remote_input,
-                    is_remote_output=is_remote_output,
-                    output=output_str if is_remote_output else Path(output_str),
-                )
-            )
+    settings.formats = format_selection
 
     # Log file path
     log_file = Path(data.get("log_file", "batch_conversion_log.json"))
@@ -593,13 +586,24 @@ def find_files_for_conversion(folder: Path, formats: FormatSelection) -> list[Pa
     if not enabled_extensions:
         return []
 
+    # str.endswith accepts a tuple, so one pass over the directory matches
+    # every enabled extension at once
+    extension_suffixes = tuple(enabled_extensions)
+
     found_files: list[Path] = []
 
-    for ext in enabled_extensions:
-        for file_path in folder.glob(f"*{ext}"):
+    # os.scandir yields DirEntry objects whose name and file type come from
+    # the readdir buffer, so non-matching siblings never need a stat() call
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.name.endswith(extension_suffixes):
+                continue
+            if not entry.is_file():
+                continue
+            file_path = Path(entry.path)
             try:
                 # For SVG files, check for text elements directly
-                if ext in (".svg", ".svgz"):
+                if entry.name.endswith((".svg", ".svgz")):
                     tree = parse_svg(file_path)
                     root = tree.getroot()
                     if root is not None:
@@ -608,8 +612,8 @@ def find_files_for_conversion(folder: Path, formats: FormatSelection) -> list[Pa
                             found_files.append(file_path)
                 else:
                     # For other formats, use the handler to check
-                    match = match_handler(str(file_path))
-                    if match.handler.can_handle(str(file_path)):
+                    match = match_handler(entry.path)
+                    if match.handler.can_handle(entry.path):
                         found_files.append(file_path)
             except Exception:
                 # Skip files that can't be parsed
@@ -11,8 +11,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 
 @dataclass
 class FontConfig:
@@ -123,6 +121,9 @@ class Config:
 
     def _merge_yaml(self, path: Path) -> None:
         """Merge YAML config file into current config."""
+        # Imported lazily: most invocations have no config file to merge
+        import yaml
+
         try:
             with open(path) as f:
                 data = yaml.safe_load(f) or {}
@@ -17,6 +17,7 @@ from pathlib import Path
 import pytest
 
 from svg_text2path.api import ConversionResult, Text2PathConverter
+from svg_text2path.exceptions import SVGParseError
 
 
 class TestText2PathConverterInit:
@@ -118,6 +119,59 @@ class TestConvertFile:
 
         assert "nonexistent.svg" in str(exc_info.value)
 
+    def test_convert_file_writes_svg_without_text(self, tmp_path: Path) -> None:
+        """convert_file() skips conversion of a text-free SVG but still writes it."""
+        converter = Text2PathConverter()
+        input_path = tmp_path / "shapes.svg"
+        output_path = tmp_path / "output.svg"
+        input_path.write_bytes(
+            b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+            b'<rect width="10" height="10"/></svg>'
+        )
+
+        result = converter.convert_file(input_path, output_path)
+
+        assert result.success
+        assert result.fast_path
+        assert result.text_count == 0
+        assert result.output == output_path
+        # Serialized by the normal writer, not copied byte for byte
+        output = output_path.read_text()
+        assert output.startswith("<?xml")
+        assert '<rect width="10" height="10" />' in output
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"not an svg at all", b'<svg xmlns="http://www.w3.org/2000/svg"><rect'],
+        ids=["non-xml", "truncated"],
+    )
+    def test_convert_file_raises_on_malformed_svg_without_text(
+        self, tmp_path: Path, content: bytes
+    ) -> None:
+        """convert_file() rejects malformed input instead of copying it."""
+        converter = Text2PathConverter()
+        input_path = tmp_path / "broken.svg"
+        output_path = tmp_path / "output.svg"
+        input_path.write_bytes(content)
+
+        with pytest.raises(SVGParseError):
+            converter.convert_file(input_path, output_path)
+
+        assert not output_path.exists()
+
+    def test_convert_file_parses_prefixed_text(self, tmp_path: Path) -> None:
+        """convert_file() does not fast-path text elements with a prefix."""
+        converter = Text2PathConverter()
+        input_path = tmp_path / "prefixed.svg"
+        input_path.write_bytes(
+            b'<s:svg xmlns:s="http://www.w3.org/2000/svg"><s:text/></s:svg>'
+        )
+
+        result = converter.convert_file(input_path, tmp_path / "output.svg")
+
+        assert not result.fast_path
+        assert result.text_count == 1
+
 
 class TestConversionResultPathElements:
     """Tests verifying conversion produces expected path elements."""
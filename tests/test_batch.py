@@ -8,7 +8,9 @@ Tests cover:
 - Batch convert command execution
 """
 
+from dataclasses import fields
 from pathlib import Path
+from string import Template
 from textwrap import dedent
 
 import pytest
@@ -25,10 +27,48 @@ from svg_text2path.cli.commands.batch import (
     _is_remote_path,
     _parse_compact_entry,
     _validate_path_format,
+    find_files_for_conversion,
     load_batch_config,
 )
 from svg_text2path.cli.main import cli
 
+# YAML config skeletons shared by the config tests, built once at import time.
+# Tests fill the $-placeholders with Template.substitute().
+_TEMPLATE_MINIMAL = Template(
+    dedent("""\
+        formats:
+          svg: true
+
+        inputs:
+          - path: $svg
+            output: $out
+    """)
+)
+
+# $settings is the indented body of the settings mapping
+_TEMPLATE_SETTINGS = Template(
+    dedent("""\
+        formats:
+          svg: true
+        settings:
+        $settings
+        inputs:
+          - path: $svg
+            output: $out
+    """)
+)
+
+# $formats is the indented body of the formats mapping
+_TEMPLATE_FORMATS = Template(
+    dedent("""\
+        formats:
+        $formats
+        inputs:
+          - path: $svg
+            output: $out
+    """)
+)
+
 
 @pytest.fixture
 def runner() -> CliRunner:
@@ -91,14 +131,7 @@ class TestLoadBatchConfig:
         """Minimal config with only required fields loads successfully."""
         config_file = tmp_path / "minimal.yaml"
         config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-
-            inputs:
-              - path: {temp_svg_file}
-                output: {tmp_path / "output.svg"}
-        """)
+            _TEMPLATE_MINIMAL.substitute(svg=temp_svg_file, out=tmp_path / "output.svg")
         )
 
         config = load_batch_config(config_file)
@@ -195,14 +228,7 @@ class TestLoadBatchConfig:
         config_file = tmp_path / "file.yaml"
         output_path = tmp_path / "output" / "result.svg"
         config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-
-            inputs:
-              - path: {temp_svg_file}
-                output: {output_path}
-        """)
+            _TEMPLATE_MINIMAL.substitute(svg=temp_svg_file, out=output_path)
         )
 
         config = load_batch_config(config_file)
@@ -237,6 +263,44 @@ class TestLoadBatchConfig:
         assert config.inputs[0].is_folder is True
         assert config.inputs[1].is_folder is False
 
+    def test_reload_returns_independent_copy(
+        self, tmp_path: Path, temp_svg_file: Path
+    ) -> None:
+        """Reloading a config returns an equal, independent object."""
+        config_file = tmp_path / "reload.yaml"
+        config_file.write_text(
+            _TEMPLATE_SETTINGS.substitute(
+                settings="  jobs: 2", svg=temp_svg_file, out=tmp_path / "output.svg"
+            )
+        )
+
+        first = load_batch_config(config_file)
+        first.settings.jobs = 99
+        second = load_batch_config(config_file)
+
+        assert second is not first
+        assert second.settings.jobs == 2
+        assert second.inputs == first.inputs
+
+    def test_reload_revalidates_against_filesystem(
+        self, tmp_path: Path, temp_svg_file: Path
+    ) -> None:
+        """Reloading the same bytes re-checks input paths on disk."""
+        # No suffix, so file vs folder mode is decided by what exists on disk
+        input_path = temp_svg_file.rename(tmp_path / "drawing")
+        config_file = tmp_path / "fs.yaml"
+        config_file.write_text(
+            _TEMPLATE_MINIMAL.substitute(svg=input_path, out=tmp_path / "output.svg")
+        )
+
+        assert load_batch_config(config_file).inputs[0].is_folder is False
+
+        # Same config bytes, but the input is now a directory
+        input_path.unlink()
+        input_path.mkdir()
+        with pytest.raises(BatchConfigError, match="folder mode requires 'output_dir'"):
+            load_batch_config(config_file)
+
 
 class TestBatchConfigValidation:
     """Tests for config validation error handling."""
@@ -329,133 +393,53 @@ class TestBatchConfigValidation:
         with pytest.raises(BatchConfigError, match="file mode requires 'output'"):
             load_batch_config(config_file)
 
-    def test_invalid_precision_range(self, tmp_path: Path, temp_svg_file: Path) -> None:
-        """Precision outside 1-10 raises BatchConfigError."""
-        config_file = tmp_path / "bad_precision.yaml"
-        config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-            settings:
-              precision: 15
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
-        )
-
-        with pytest.raises(
-            BatchConfigError, match="settings.precision: must be between 1 and 10"
-        ):
-            load_batch_config(config_file)
-
-    def test_invalid_pixel_threshold_range(
-        self, tmp_path: Path, temp_svg_file: Path
-    ) -> None:
-        """Pixel threshold outside 1-255 raises BatchConfigError."""
-        config_file = tmp_path / "bad_threshold.yaml"
-        config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-            settings:
-              verify_pixel_threshold: 300
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
-        )
-
-        with pytest.raises(
-            BatchConfigError,
-            match="settings.verify_pixel_threshold: must be between 1 and 255",
-        ):
-            load_batch_config(config_file)
-
-    def test_invalid_image_threshold_range(
-        self, tmp_path: Path, temp_svg_file: Path
-    ) -> None:
-        """Image threshold outside 0-100 raises BatchConfigError."""
-        config_file = tmp_path / "bad_img_threshold.yaml"
-        config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-            settings:
-              verify_image_threshold: 150.0
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
-        )
-
-        with pytest.raises(
-            BatchConfigError,
-            match="settings.verify_image_threshold: must be between 0.0 and 100.0",
-        ):
-            load_batch_config(config_file)
-
-    def test_invalid_jobs_value(self, tmp_path: Path, temp_svg_file: Path) -> None:
-        """Jobs less than 1 raises BatchConfigError."""
-        config_file = tmp_path / "bad_jobs.yaml"
-        config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-            settings:
-              jobs: 0
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
-        )
-
-        with pytest.raises(BatchConfigError, match="settings.jobs: must be at least 1"):
-            load_batch_config(config_file)
-
-    def test_invalid_type_in_settings(
-        self, tmp_path: Path, temp_svg_file: Path
+    @pytest.mark.parametrize(
+        ("settings", "match"),
+        [
+            pytest.param(
+                "  precision: 15",
+                "settings.precision: must be between 1 and 10",
+                id="precision_range",
+            ),
+            pytest.param(
+                "  verify_pixel_threshold: 300",
+                "settings.verify_pixel_threshold: must be between 1 and 255",
+                id="pixel_threshold_range",
+            ),
+            pytest.param(
+                "  verify_image_threshold: 150.0",
+                "settings.verify_image_threshold: must be between 0.0 and 100.0",
+                id="image_threshold_range",
+            ),
+            pytest.param(
+                "  jobs: 0",
+                "settings.jobs: must be at least 1",
+                id="jobs_value",
+            ),
+            pytest.param(
+                '  precision: "high"',
+                "settings.precision: expected integer, got str",
+                id="type_in_settings",
+            ),
+            pytest.param(
+                "  font_dirs:\n    - /valid/path\n    - 123",
+                "settings.font_dirs\\[1\\]: expected string path, got int",
+                id="font_dirs_type",
+            ),
+        ],
+    )
+    def test_invalid_settings_raise(
+        self, tmp_path: Path, temp_svg_file: Path, settings: str, match: str
     ) -> None:
-        """Wrong type for setting value raises BatchConfigError."""
-        config_file = tmp_path / "bad_type.yaml"
+        """Out-of-range or wrongly typed settings raise BatchConfigError."""
+        config_file = tmp_path / "bad_settings.yaml"
         config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-            settings:
-              precision: "high"
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
-        )
-
-        with pytest.raises(
-            BatchConfigError, match="settings.precision: expected integer, got str"
-        ):
-            load_batch_config(config_file)
-
-    def test_invalid_font_dirs_type(self, tmp_path: Path, temp_svg_file: Path) -> None:
-        """Non-string in font_dirs raises BatchConfigError."""
-        config_file = tmp_path / "bad_fonts.yaml"
-        config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-            settings:
-              font_dirs:
-                - /valid/path
-                - 123
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
+            _TEMPLATE_SETTINGS.substitute(
+                settings=settings, svg=temp_svg_file, out="out.svg"
+            )
         )
 
-        with pytest.raises(
-            BatchConfigError,
-            match="settings.font_dirs\\[1\\]: expected string path, got int",
-        ):
+        with pytest.raises(BatchConfigError, match=match):
             load_batch_config(config_file)
 
     def test_file_not_found_raises(self, tmp_path: Path) -> None:
@@ -718,6 +702,12 @@ class TestFormatSelection:
         assert formats.plaintext is False
         assert formats.epub is False
 
+    def test_field_names_match_dataclass_fields(self) -> None:
+        """Precomputed field names stay in sync with the dataclass fields."""
+        names = {f.name for f in fields(FormatSelection)}
+
+        assert names == FormatSelection._FIELD_NAMES
+
     def test_missing_formats_section_defaults_to_svg(
         self, tmp_path: Path, temp_svg_file: Path
     ) -> None:
@@ -743,25 +733,24 @@ class TestFormatSelection:
     ) -> None:
         """Config with all formats explicitly disabled raises BatchConfigError."""
         config_file = tmp_path / "all_formats_disabled.yaml"
+        formats = (
+            "  svg: false\n"
+            "  svgz: false\n"
+            "  html: false\n"
+            "  css: false\n"
+            "  json: false\n"
+            "  csv: false\n"
+            "  markdown: false\n"
+            "  python: false\n"
+            "  javascript: false\n"
+            "  rst: false\n"
+            "  plaintext: false\n"
+            "  epub: false"
+        )
         config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: false
-              svgz: false
-              html: false
-              css: false
-              json: false
-              csv: false
-              markdown: false
-              python: false
-              javascript: false
-              rst: false
-              plaintext: false
-              epub: false
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
+            _TEMPLATE_FORMATS.substitute(
+                formats=formats, svg=temp_svg_file, out="out.svg"
+            )
         )
 
         with pytest.raises(
@@ -773,15 +762,11 @@ class TestFormatSelection:
     def test_unknown_format_warns(self, tmp_path: Path, temp_svg_file: Path) -> None:
         """Config with unknown format raises BatchConfigError."""
         config_file = tmp_path / "unknown_format.yaml"
+        formats = "  svg: true\n  unknown_format: true"
         config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-              unknown_format: true
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
+            _TEMPLATE_FORMATS.substitute(
+                formats=formats, svg=temp_svg_file, out="out.svg"
+            )
         )
 
         with pytest.raises(BatchConfigError, match="unknown format"):
@@ -793,13 +778,9 @@ class TestFormatSelection:
         """Config with non-boolean format value raises BatchConfigError."""
         config_file = tmp_path / "bad_format_type.yaml"
         config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: "yes"
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
+            _TEMPLATE_FORMATS.substitute(
+                formats='  svg: "yes"', svg=temp_svg_file, out="out.svg"
+            )
         )
 
         with pytest.raises(BatchConfigError, match="expected boolean"):
@@ -810,17 +791,11 @@ class TestFormatSelection:
     ) -> None:
         """Config with multiple formats enabled loads correctly."""
         config_file = tmp_path / "multi_formats.yaml"
+        formats = "  svg: true\n  svgz: true\n  html: true\n  python: false"
         config_file.write_text(
-            dedent(f"""
-            formats:
-              svg: true
-              svgz: true
-              html: true
-              python: false
-            inputs:
-              - path: {temp_svg_file}
-                output: out.svg
-        """)
+            _TEMPLATE_FORMATS.substitute(
+                formats=formats, svg=temp_svg_file, out="out.svg"
+            )
         )
 
         config = load_batch_config(config_file)
@@ -831,6 +806,26 @@ class TestFormatSelection:
         assert config.settings.formats.python is False
 
 
+class TestFindFilesForConversion:
+    """Tests for folder-mode input expansion."""
+
+    def test_finds_only_svg_with_text(self, temp_svg_folder: Path) -> None:
+        """Only SVG files containing text elements are selected."""
+        found = find_files_for_conversion(temp_svg_folder, FormatSelection())
+
+        assert found == [temp_svg_folder / "has_text.svg"]
+
+    def test_skips_non_matching_siblings(self, temp_svg_folder: Path) -> None:
+        """Other extensions and directories named like SVG files are ignored."""
+        (temp_svg_folder / "notes.txt").write_text("not an svg")
+        (temp_svg_folder / "dir.svg").mkdir()
+        (temp_svg_folder / "packed.svgz").write_bytes(b"")
+
+        found = find_files_for_conversion(temp_svg_folder, FormatSelection())
+
+        assert found == [temp_svg_folder / "has_text.svg"]
+
+
 # ---------------------------------------------------------------------------
 # Tests for compact input format and remote paths
 # ---------------------------------------------------------------------------
@@ -1,7 +1,8 @@
 """Tests for the compare CLI command.
 
-Coverage: 12 tests covering compare command options, error handling, and exit codes.
-Tests use Click's CliRunner for isolated command invocation.
+Coverage: 15 tests covering compare command options, error handling, and exit codes.
+Tests use Click's CliRunner for isolated command invocation. The input SVG
+fixtures are read-only, so they are written once per session.
 
 Coverage targets:
 - compare() main function entry point
@@ -13,54 +14,206 @@ Coverage targets:
 
 from __future__ import annotations
 
+import importlib
+import io
+import re
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
+from PIL import Image
 
 from svg_text2path.cli.main import cli
 
+# The commands package re-exports the ``compare`` click command, which shadows
+# the module itself in dotted attribute lookups, so resolve the module directly
+compare_module = importlib.import_module("svg_text2path.cli.commands.compare")
 
-@pytest.fixture
+# All tests but --help invoke the subcommand directly, skipping group dispatch
+compare_cmd = cli.commands["compare"]
+
+# 200x100 SVG document around a single {body} element
+_SVG_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="200" height="100" viewBox="0 0 200 100">
+  {body}
+</svg>"""
+
+# Fixture contents, encoded once: the original with text, and the converted
+# (and Inkscape reference) version with the text replaced by a path
+_TEXT_SVG_BYTES = _SVG_TEMPLATE.format(
+    body='<text x="10" y="50" font-family="Arial" font-size="24">Hello World</text>'
+).encode("utf-8")
+_PATHS_SVG_BYTES = _SVG_TEMPLATE.format(
+    body='<path d="M10 50 L50 50 L50 30 L10 30 Z" fill="black"/>'
+).encode("utf-8")
+
+
+def _make_png_bytes() -> bytes:
+    """Encode a blank 200x100 white RGBA PNG."""
+    img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+# Encoded once at import; every mocked render writes these same bytes
+_DUMMY_PNG = _make_png_bytes()
+
+
+# Main arguments and key options that compare --help must document
+_HELP_TOKENS = frozenset(
+    {
+        "REFERENCE",
+        "CONVERTED",
+        "--threshold",
+        "--pixel-perfect",
+        "--generate-diff",
+        "--grayscale-diff",
+        "--output-dir",
+        "--inkscape-svg",
+        "--no-html",
+    }
+)
+
+# Case-insensitive words looked for in command output, compiled once
+_REF_CONV_RE = re.compile(r"reference|converted", re.IGNORECASE)
+_TOOL_RE = re.compile(r"node|npx", re.IGNORECASE)
+
+
+def _found_words(pattern: re.Pattern[str], output: str) -> set[str]:
+    """Return the lowercased matches of pattern in output, in a single scan."""
+    return {match.group().lower() for match in pattern.finditer(output)}
+
+
+def _write_dummy_png(_svg_path: Path, png_path: Path) -> bool:
+    """Stand-in for SVGRenderer.render_svg_to_png that writes the dummy PNG."""
+    png_path.write_bytes(_DUMMY_PNG)
+    return True
+
+
+def _pixel_stats(diff_pct: float) -> tuple[bool, dict[str, float]]:
+    """Build a compare_images_pixel_perfect result for a 200x100 image."""
+    return True, {
+        "total_pixels": 20000,
+        "diff_pixels": int(20000 * diff_pct / 100),
+        "diff_percentage": diff_pct,
+    }
+
+
+def _invoke_pixel_perfect(
+    runner: CliRunner, reference: Path, converted: Path, output_dir: Path, *extra: str
+) -> Result:
+    """Run ``compare --pixel-perfect`` into output_dir with extra arguments."""
+    args = [
+        str(reference),
+        str(converted),
+        "--pixel-perfect",
+        *extra,
+        "--output-dir",
+        str(output_dir),
+    ]
+    return runner.invoke(compare_cmd, args, catch_exceptions=False)
+
+
+@pytest.fixture(scope="module")
 def runner() -> CliRunner:
-    """Create a CliRunner instance for testing CLI commands."""
+    """Create a CliRunner shared by the module (it keeps no per-test state)."""
     return CliRunner()
 
 
+@pytest.fixture(scope="class")
+def _patched_compare() -> Iterator[SimpleNamespace]:
+    """Patch the compare module's collaborators once per test class.
+
+    Only the comparator is a MagicMock, since tests configure its results
+    and check it was called; the other stand-ins are plain callables reading
+    or appending to the yielded namespace, which compare_mocks resets before
+    every test.
+    """
+    mocks = SimpleNamespace(
+        deps_result=(True, []),
+        comparator=MagicMock(),
+        diff_image_calls=[],
+        grayscale_map_calls=[],
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            compare_module, "check_visual_comparison_deps", lambda: mocks.deps_result
+        )
+        mp.setattr(
+            compare_module,
+            "SVGRenderer",
+            SimpleNamespace(render_svg_to_png=_write_dummy_png),
+        )
+        mp.setattr(compare_module, "ImageComparator", mocks.comparator)
+        mp.setattr(
+            compare_module,
+            "generate_diff_image",
+            lambda *args: mocks.diff_image_calls.append(args),
+        )
+        mp.setattr(
+            compare_module,
+            "generate_grayscale_diff_map",
+            lambda *args: mocks.grayscale_map_calls.append(args),
+        )
+        yield mocks
+
+
 @pytest.fixture
-def reference_svg(tmp_path: Path) -> Path:
+def compare_mocks(_patched_compare: SimpleNamespace) -> SimpleNamespace:
+    """Stand-ins for the compare command's dependency check, renderer and comparators.
+
+    Dependencies are reported as available, rendering writes the dummy PNG
+    and the pixel comparison reports no difference by default.
+
+    Returns:
+        Namespace with ``deps_result`` (returned by the dependency check),
+        ``comparator`` (the ImageComparator mock) and ``diff_image_calls`` /
+        ``grayscale_map_calls`` (argument tuples of each generator call)
+    """
+    mocks = _patched_compare
+    mocks.deps_result = (True, [])
+    mocks.comparator.reset_mock(return_value=True, side_effect=True)
+    mocks.comparator.compare_images_pixel_perfect.return_value = _pixel_stats(0.0)
+    mocks.diff_image_calls.clear()
+    mocks.grayscale_map_calls.clear()
+    return mocks
+
+
+@pytest.fixture(scope="session")
+def diffs_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Output directory shared by tests that never inspect its contents.
+
+    Every run writes the same mocked PNG names, so reusing one directory is
+    safe and spares a fresh tmp_path tree per test.
+    """
+    return tmp_path_factory.mktemp("diffs")
+
+
+@pytest.fixture(scope="session")
+def reference_svg(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a reference SVG file for comparison testing."""
-    svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="100" viewBox="0 0 200 100">
-  <text x="10" y="50" font-family="Arial" font-size="24">Hello World</text>
-</svg>"""
-    svg_path = tmp_path / "reference.svg"
-    svg_path.write_text(svg_content, encoding="utf-8")
+    svg_path = tmp_path_factory.mktemp("svg_fixtures") / "reference.svg"
+    svg_path.write_bytes(_TEXT_SVG_BYTES)
     return svg_path
 
 
-@pytest.fixture
-def converted_svg(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def converted_svg(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a converted SVG file (paths instead of text) for comparison."""
-    svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="100" viewBox="0 0 200 100">
-  <path d="M10 50 L50 50 L50 30 L10 30 Z" fill="black"/>
-</svg>"""
-    svg_path = tmp_path / "converted.svg"
-    svg_path.write_text(svg_content, encoding="utf-8")
+    svg_path = tmp_path_factory.mktemp("svg_fixtures") / "converted.svg"
+    svg_path.write_bytes(_PATHS_SVG_BYTES)
     return svg_path
 
 
-@pytest.fixture
-def inkscape_svg(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def inkscape_svg(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create an Inkscape reference SVG for 3-way comparison."""
-    svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="100" viewBox="0 0 200 100">
-  <path d="M10 50 L50 50 L50 30 L10 30 Z" fill="black"/>
-</svg>"""
-    svg_path = tmp_path / "inkscape_ref.svg"
-    svg_path.write_text(svg_content, encoding="utf-8")
+    svg_path = tmp_path_factory.mktemp("svg_fixtures") / "inkscape_ref.svg"
+    svg_path.write_bytes(_PATHS_SVG_BYTES)
     return svg_path
 
 
@@ -69,488 +222,233 @@ class TestCompareCommandHelp:
 
     def test_compare_help_shows_options(self, runner: CliRunner) -> None:
         """Compare command --help shows all available options."""
-        result = runner.invoke(cli, ["compare", "--help"])
+        result = runner.invoke(cli, ["compare", "--help"], catch_exceptions=False)
         assert result.exit_code == 0
 
-        # Check main arguments are documented
-        assert "REFERENCE" in result.output
-        assert "CONVERTED" in result.output
-
-        # Check key options are listed
-        assert "--threshold" in result.output
-        assert "--pixel-perfect" in result.output
-        assert "--generate-diff" in result.output
-        assert "--grayscale-diff" in result.output
-        assert "--output-dir" in result.output
-        assert "--inkscape-svg" in result.output
-        assert "--no-html" in result.output
+        # Result.output decodes the captured bytes on every access; read it once
+        output = result.output
+        missing = {token for token in _HELP_TOKENS if token not in output}
+        assert not missing, f"help missing: {sorted(missing)}"
 
 
 class TestCompareCommandArguments:
     """Tests for compare command argument handling."""
 
-    def test_compare_missing_reference_file_shows_error(
-        self, runner: CliRunner
-    ) -> None:
-        """Compare command without arguments shows missing argument error."""
-        result = runner.invoke(cli, ["compare"])
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output or "Usage:" in result.output
-
-    def test_compare_missing_converted_file_shows_error(
-        self, runner: CliRunner, reference_svg: Path
-    ) -> None:
-        """Compare command with only reference file shows missing argument."""
-        result = runner.invoke(cli, ["compare", str(reference_svg)])
-        assert result.exit_code != 0
-        assert "Missing argument" in result.output or "Usage:" in result.output
-
-    def test_compare_nonexistent_reference_shows_error(
-        self, runner: CliRunner, converted_svg: Path, tmp_path: Path
-    ) -> None:
-        """Compare command with non-existent reference file shows error."""
-        fake_ref = tmp_path / "nonexistent.svg"
-        result = runner.invoke(cli, ["compare", str(fake_ref), str(converted_svg)])
-        assert result.exit_code != 0
-        # Click shows path validation error
-        assert "does not exist" in result.output or "Invalid value" in result.output
-
-    def test_compare_nonexistent_converted_shows_error(
-        self, runner: CliRunner, reference_svg: Path, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("build_args", "expected"),
+        [
+            # No arguments at all
+            pytest.param(
+                lambda ref, conv, missing: [],
+                ("Missing argument", "Usage:"),
+                id="no-args",
+            ),
+            # Only the reference file
+            pytest.param(
+                lambda ref, conv, missing: [str(ref)],
+                ("Missing argument", "Usage:"),
+                id="one-arg",
+            ),
+            # Click path validation rejects a nonexistent reference
+            pytest.param(
+                lambda ref, conv, missing: [str(missing), str(conv)],
+                ("does not exist", "Invalid value"),
+                id="bad-ref",
+            ),
+            # ... and a nonexistent converted file
+            pytest.param(
+                lambda ref, conv, missing: [str(ref), str(missing)],
+                ("does not exist", "Invalid value"),
+                id="bad-conv",
+            ),
+        ],
+    )
+    def test_argument_errors(
+        self,
+        runner: CliRunner,
+        reference_svg: Path,
+        converted_svg: Path,
+        tmp_path: Path,
+        build_args: Callable[[Path, Path, Path], list[str]],
+        expected: tuple[str, ...],
     ) -> None:
-        """Compare command with non-existent converted file shows error."""
-        fake_conv = tmp_path / "nonexistent.svg"
-        result = runner.invoke(cli, ["compare", str(reference_svg), str(fake_conv)])
+        """Missing or nonexistent file arguments fail with a usage error."""
+        args = build_args(reference_svg, converted_svg, tmp_path / "nonexistent.svg")
+        result = runner.invoke(compare_cmd, args)
         assert result.exit_code != 0
-        assert "does not exist" in result.output or "Invalid value" in result.output
+        output = result.output
+        assert any(text in output for text in expected)
 
 
 class TestComparePixelPerfectMode:
     """Tests for --pixel-perfect comparison mode."""
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
     def test_pixel_perfect_uses_image_comparator(
         self,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
+        compare_mocks: SimpleNamespace,
         runner: CliRunner,
         reference_svg: Path,
         converted_svg: Path,
-        tmp_path: Path,
+        diffs_dir: Path,
     ) -> None:
         """--pixel-perfect flag uses ImageComparator instead of svg-bbox."""
-        # Mock dependencies as available
-        mock_deps.return_value = (True, [])
-
-        # Mock render_svg_to_png to create dummy PNG files
-        def create_dummy_png(_svg_path: Path, png_path: Path) -> bool:
-            # Create a small valid PNG
-            from PIL import Image
-
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-
-        # Mock comparison result
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 0, "diff_percentage": 0.0},
-        )
-
-        result = runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--output-dir",
-                str(tmp_path / "diffs"),
-            ],
-        )
+        result = _invoke_pixel_perfect(runner, reference_svg, converted_svg, diffs_dir)
 
         # Should call ImageComparator
-        assert mock_comparator.compare_images_pixel_perfect.called
+        assert compare_mocks.comparator.compare_images_pixel_perfect.called
         # Should show pixel-perfect mode in output
-        assert "Pixel-perfect" in result.output or result.exit_code == 0
+        assert result.exit_code == 0 or "Pixel-perfect" in result.output
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
     def test_pixel_tolerance_option(
         self,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
+        compare_mocks: SimpleNamespace,
         runner: CliRunner,
         reference_svg: Path,
         converted_svg: Path,
-        tmp_path: Path,
+        diffs_dir: Path,
     ) -> None:
         """--pixel-tolerance option sets color difference tolerance."""
-        mock_deps.return_value = (True, [])
-
-        def create_dummy_png(_svg_path: Path, png_path: Path) -> bool:
-            from PIL import Image
-
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 100, "diff_percentage": 0.5},
-        )
-
-        _result = runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--pixel-tolerance",
-                "0.05",
-                "--output-dir",
-                str(tmp_path / "diffs"),
-            ],
+        captured: dict[str, float] = {}
+
+        # Record only the tolerance instead of inspecting the mock's call_args
+        def spy(*_: Path, **kwargs: float) -> tuple[bool, dict[str, float]]:
+            captured["pixel_tolerance"] = kwargs["pixel_tolerance"]
+            return _pixel_stats(0.5)
+
+        compare_mocks.comparator.compare_images_pixel_perfect.side_effect = spy
+
+        _invoke_pixel_perfect(
+            runner,
+            reference_svg,
+            converted_svg,
+            diffs_dir,
+            "--pixel-tolerance",
+            "0.05",
         )
 
         # Verify tolerance was passed to comparator
-        call_args = mock_comparator.compare_images_pixel_perfect.call_args
-        assert call_args is not None
-        assert call_args.kwargs.get("pixel_tolerance") == 0.05
+        assert captured.get("pixel_tolerance") == 0.05
 
 
 class TestCompareThreshold:
     """Tests for --threshold option and exit code behavior."""
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
-    def test_diff_below_threshold_exits_zero(
-        self,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
-        runner: CliRunner,
-        reference_svg: Path,
-        converted_svg: Path,
-        tmp_path: Path,
-    ) -> None:
-        """Diff percentage below threshold results in exit code 0 (PASS)."""
-        mock_deps.return_value = (True, [])
-
-        def create_dummy_png(_: Path, png_path: Path) -> bool:
-            from PIL import Image
-
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-        # Return 0.3% diff, below 0.5% threshold
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 60, "diff_percentage": 0.3},
-        )
-
-        result = runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--threshold",
-                "0.5",
-                "--output-dir",
-                str(tmp_path / "diffs"),
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "PASS" in result.output
-
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
-    def test_diff_above_threshold_exits_one(
+    @pytest.mark.parametrize(
+        ("diff_pct", "expected_exit", "expected_verdict"),
+        [
+            pytest.param(0.3, 0, "PASS", id="below_threshold"),
+            pytest.param(1.5, 1, "FAIL", id="above_threshold"),
+        ],
+    )
+    def test_exit_code_follows_threshold(
         self,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
+        compare_mocks: SimpleNamespace,
         runner: CliRunner,
         reference_svg: Path,
         converted_svg: Path,
-        tmp_path: Path,
+        diffs_dir: Path,
+        diff_pct: float,
+        expected_exit: int,
+        expected_verdict: str,
     ) -> None:
-        """Diff percentage above threshold results in exit code 1 (FAIL)."""
-        mock_deps.return_value = (True, [])
-
-        def create_dummy_png(_: Path, png_path: Path) -> bool:
-            from PIL import Image
-
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-        # Return 1.5% diff, above 0.5% threshold
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 300, "diff_percentage": 1.5},
+        """Diff below the 0.5% threshold passes (exit 0), above it fails (exit 1)."""
+        compare_mocks.comparator.compare_images_pixel_perfect.return_value = (
+            _pixel_stats(diff_pct)
         )
 
-        result = runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--threshold",
-                "0.5",
-                "--output-dir",
-                str(tmp_path / "diffs"),
-            ],
+        result = _invoke_pixel_perfect(
+            runner,
+            reference_svg,
+            converted_svg,
+            diffs_dir,
+            "--threshold",
+            "0.5",
         )
 
-        assert result.exit_code == 1
-        assert "FAIL" in result.output
+        assert result.exit_code == expected_exit, result.output
+        assert expected_verdict in result.output
 
 
 class TestCompareDiffImageGeneration:
     """Tests for --generate-diff and --grayscale-diff options."""
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
-    @patch("svg_text2path.cli.commands.compare.generate_diff_image")
-    def test_generate_diff_creates_diff_image(
+    @pytest.mark.parametrize(
+        ("flag", "generator"),
+        [
+            pytest.param("--generate-diff", "diff_image_calls", id="red_overlay"),
+            pytest.param("--grayscale-diff", "grayscale_map_calls", id="grayscale"),
+        ],
+    )
+    def test_diff_flag_calls_generator(
         self,
-        mock_gen_diff: MagicMock,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
+        compare_mocks: SimpleNamespace,
         runner: CliRunner,
         reference_svg: Path,
         converted_svg: Path,
-        tmp_path: Path,
+        diffs_dir: Path,
+        flag: str,
+        generator: str,
     ) -> None:
-        """--generate-diff option creates red-overlay diff image."""
-        mock_deps.return_value = (True, [])
-        output_dir = tmp_path / "diffs"
-
-        def create_dummy_png(_: Path, png_path: Path) -> bool:
-            from PIL import Image
-
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 0, "diff_percentage": 0.0},
-        )
-
-        runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--generate-diff",
-                "--output-dir",
-                str(output_dir),
-            ],
-        )
-
-        # generate_diff_image should be called
-        assert mock_gen_diff.called
-
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
-    @patch("svg_text2path.cli.commands.compare.generate_grayscale_diff_map")
-    def test_grayscale_diff_creates_grayscale_map(
-        self,
-        mock_grayscale: MagicMock,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
-        runner: CliRunner,
-        reference_svg: Path,
-        converted_svg: Path,
-        tmp_path: Path,
-    ) -> None:
-        """--grayscale-diff option creates grayscale magnitude diff map."""
-        mock_deps.return_value = (True, [])
-        output_dir = tmp_path / "diffs"
-
-        def create_dummy_png(_: Path, png_path: Path) -> bool:
-            from PIL import Image
+        """Each diff flag calls its diff image generator."""
+        _invoke_pixel_perfect(runner, reference_svg, converted_svg, diffs_dir, flag)
 
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 0, "diff_percentage": 0.0},
-        )
-
-        runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--grayscale-diff",
-                "--output-dir",
-                str(output_dir),
-            ],
-        )
-
-        # generate_grayscale_diff_map should be called
-        assert mock_grayscale.called
+        assert getattr(compare_mocks, generator)
 
 
 class TestCompareDependencyChecks:
     """Tests for dependency checking behavior."""
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    def test_missing_node_shows_error(
+    @pytest.mark.parametrize("tool", ["node", "npx"])
+    def test_missing_tool_shows_error(
         self,
-        mock_deps: MagicMock,
+        compare_mocks: SimpleNamespace,
         runner: CliRunner,
         reference_svg: Path,
         converted_svg: Path,
+        tool: str,
     ) -> None:
-        """Missing node dependency shows helpful error message."""
-        mock_deps.return_value = (False, ["node"])
-
-        result = runner.invoke(cli, ["compare", str(reference_svg), str(converted_svg)])
-
-        assert result.exit_code == 1
-        assert "node" in result.output.lower()
+        """A missing node or npx dependency shows a helpful error message."""
+        compare_mocks.deps_result = (False, [tool])
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    def test_missing_npx_shows_error(
-        self,
-        mock_deps: MagicMock,
-        runner: CliRunner,
-        reference_svg: Path,
-        converted_svg: Path,
-    ) -> None:
-        """Missing npx dependency shows helpful error message."""
-        mock_deps.return_value = (False, ["npx"])
-
-        result = runner.invoke(cli, ["compare", str(reference_svg), str(converted_svg)])
+        result = runner.invoke(
+            compare_cmd,
+            [str(reference_svg), str(converted_svg)],
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 1
-        assert "npx" in result.output.lower() or "npm" in result.output.lower()
+        assert tool in _found_words(_TOOL_RE, result.output)
 
 
 class TestCompareOutputOptions:
     """Tests for output-related options."""
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
     def test_output_dir_creates_directory(
         self,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
+        compare_mocks: SimpleNamespace,
         runner: CliRunner,
         reference_svg: Path,
         converted_svg: Path,
         tmp_path: Path,
     ) -> None:
         """--output-dir option creates output directory if needed."""
-        mock_deps.return_value = (True, [])
         output_dir = tmp_path / "new_diffs"
 
-        def create_dummy_png(_: Path, png_path: Path) -> bool:
-            from PIL import Image
-
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 0, "diff_percentage": 0.0},
-        )
-
-        runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--output-dir",
-                str(output_dir),
-            ],
-        )
+        _invoke_pixel_perfect(runner, reference_svg, converted_svg, output_dir)
 
         # Output directory should be created
         assert output_dir.exists()
 
-    @patch("svg_text2path.cli.commands.compare.check_visual_comparison_deps")
-    @patch("svg_text2path.cli.commands.compare.SVGRenderer")
-    @patch("svg_text2path.cli.commands.compare.ImageComparator")
     def test_comparison_reports_file_paths(
         self,
-        mock_comparator: MagicMock,
-        mock_renderer: MagicMock,
-        mock_deps: MagicMock,
+        compare_mocks: SimpleNamespace,
         runner: CliRunner,
         reference_svg: Path,
         converted_svg: Path,
-        tmp_path: Path,
+        diffs_dir: Path,
     ) -> None:
         """Comparison output includes reference and converted file paths."""
-        mock_deps.return_value = (True, [])
-
-        def create_dummy_png(_: Path, png_path: Path) -> bool:
-            from PIL import Image
-
-            img = Image.new("RGBA", (200, 100), color=(255, 255, 255, 255))
-            img.save(png_path, "PNG")
-            return True
-
-        mock_renderer.render_svg_to_png.side_effect = create_dummy_png
-        mock_comparator.compare_images_pixel_perfect.return_value = (
-            True,
-            {"total_pixels": 20000, "diff_pixels": 0, "diff_percentage": 0.0},
-        )
-
-        result = runner.invoke(
-            cli,
-            [
-                "compare",
-                str(reference_svg),
-                str(converted_svg),
-                "--pixel-perfect",
-                "--output-dir",
-                str(tmp_path / "diffs"),
-            ],
-        )
+        result = _invoke_pixel_perfect(runner, reference_svg, converted_svg, diffs_dir)
 
         # Output should mention the file names
-        assert "reference" in result.output.lower()
-        assert "converted" in result.output.lower()
+        assert {"reference", "converted"} <= _found_words(_REF_CONV_RE, result.output)
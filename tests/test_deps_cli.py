@@ -2,7 +2,8 @@
 
 Coverage: 8 tests covering CLI help, basic execution, filter options,
 JSON output, strict mode exit codes, and missing dependency detection.
-Tests use CliRunner for isolated command invocation.
+Tests use CliRunner for isolated command invocation. The runner and the
+mock reports are never mutated, so they are built once and shared.
 """
 
 import json
@@ -20,6 +21,15 @@ from svg_text2path.tools.dependencies import (
     DependencyType,
 )
 
+# ANSI escape sequences (CSI and single-character escapes), compiled once
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+# Greedy match from the first { to the last }, spanning newlines
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# DependencyReport list fields, one per --*-only filter
+_CATEGORIES = frozenset({"python_packages", "system_tools", "npm_packages"})
+
 
 def extract_json_from_output(output: str) -> dict:
     """Extract JSON object from CLI output that may contain ANSI codes or banners.
@@ -27,25 +37,23 @@ def extract_json_from_output(output: str) -> dict:
     Rich's print_json outputs formatted JSON with possible styling.
     This function finds and extracts the JSON portion.
     """
-    # Remove ANSI escape codes
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    clean = ansi_escape.sub("", output)
+    # Remove ANSI escape codes; CliRunner output is usually plain, so skip the
+    # regex pass when there is no ESC character at all
+    clean = _ANSI_RE.sub("", output) if "\x1b" in output else output
     # Find JSON object boundaries (first { to last })
-    start = clean.find("{")
-    end = clean.rfind("}") + 1
-    if start == -1 or end == 0:
+    match = _JSON_OBJ_RE.search(clean)
+    if match is None:
         raise ValueError(f"No JSON found in output: {output[:200]}")
-    json_str = clean[start:end]
-    return json.loads(json_str)
+    return json.loads(match.group(0))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
-    """Create a CliRunner instance for testing CLI commands."""
+    """Create a CliRunner shared by all tests (it keeps no per-test state)."""
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_report_all_ok() -> DependencyReport:
     """Create a DependencyReport where all required dependencies are satisfied."""
     return DependencyReport(
@@ -90,7 +98,7 @@ def mock_report_all_ok() -> DependencyReport:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_report_missing_required() -> DependencyReport:
     """Create a DependencyReport with missing required dependencies."""
     return DependencyReport(
@@ -116,7 +124,7 @@ def mock_report_missing_required() -> DependencyReport:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_report_missing_optional() -> DependencyReport:
     """Create a DependencyReport with only optional dependencies missing."""
     return DependencyReport(
@@ -143,6 +151,21 @@ def mock_report_missing_optional() -> DependencyReport:
     )
 
 
+@pytest.fixture(scope="module")
+def deps_json_output(runner: CliRunner, mock_report_all_ok: DependencyReport) -> dict:
+    """Run deps --json once against the all-OK report and parse its output.
+
+    Module-scoped: the JSON output tests only read the parsed dict.
+    """
+    with patch(
+        "svg_text2path.cli.commands.deps.verify_all_dependencies",
+        return_value=mock_report_all_ok,
+    ):
+        result = runner.invoke(cli, ["deps", "--json"])
+    assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
+    return extract_json_from_output(result.output)
+
+
 class TestDepsHelp:
     """Tests for the deps command help text."""
 
@@ -190,157 +213,103 @@ class TestDepsBasicExecution:
 class TestDepsFilterOptions:
     """Tests for deps command filter options."""
 
-    def test_deps_python_only_checks_only_python_packages(
-        self, runner: CliRunner, mock_report_all_ok: DependencyReport
-    ) -> None:
-        """deps --python-only only checks Python packages."""
-        # Create a report that simulates python-only check (empty system/npm)
-        python_only_report = DependencyReport(
-            python_packages=mock_report_all_ok.python_packages,
-            system_tools=[],
-            npm_packages=[],
-        )
-        with patch(
-            "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=python_only_report,
-        ):
-            result = runner.invoke(cli, ["deps", "--python-only", "--json"])
-            assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
-            data = extract_json_from_output(result.output)
-            # Python packages should be populated
-            assert "python_packages" in data
-            assert len(data["python_packages"]) > 0
-            # System tools and npm should be empty (not checked)
-            assert data["system_tools"] == []
-            assert data["npm_packages"] == []
-
-    def test_deps_system_only_checks_only_system_tools(
-        self, runner: CliRunner, mock_report_all_ok: DependencyReport
-    ) -> None:
-        """deps --system-only only checks system tools."""
-        # Create a report that simulates system-only check (empty python/npm)
-        system_only_report = DependencyReport(
-            python_packages=[],
-            system_tools=mock_report_all_ok.system_tools,
-            npm_packages=[],
-        )
-        with patch(
-            "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=system_only_report,
-        ):
-            result = runner.invoke(cli, ["deps", "--system-only", "--json"])
-            assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
-            data = extract_json_from_output(result.output)
-            # System tools should be populated
-            assert "system_tools" in data
-            assert len(data["system_tools"]) > 0
-            # Python and npm should be empty (not checked)
-            assert data["python_packages"] == []
-            assert data["npm_packages"] == []
-
-    def test_deps_npm_only_checks_only_npm_packages(
-        self, runner: CliRunner, mock_report_all_ok: DependencyReport
+    @pytest.mark.parametrize(
+        ("flag", "kept"),
+        [
+            ("--python-only", "python_packages"),
+            ("--system-only", "system_tools"),
+            ("--npm-only", "npm_packages"),
+        ],
+    )
+    def test_deps_filter_only_checks_requested(
+        self,
+        runner: CliRunner,
+        mock_report_all_ok: DependencyReport,
+        flag: str,
+        kept: str,
     ) -> None:
-        """deps --npm-only only checks npm packages."""
-        # Create a report that simulates npm-only check (empty python/system)
-        npm_only_report = DependencyReport(
-            python_packages=[],
-            system_tools=[],
-            npm_packages=mock_report_all_ok.npm_packages,
+        """Each --*-only flag reports only its own dependency category."""
+        # Create a report that simulates the filtered check (other lists empty)
+        filtered_report = DependencyReport(
+            **{
+                category: getattr(mock_report_all_ok, category)
+                if category == kept
+                else []
+                for category in _CATEGORIES
+            }
         )
         with patch(
             "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=npm_only_report,
+            return_value=filtered_report,
         ):
-            result = runner.invoke(cli, ["deps", "--npm-only", "--json"])
+            result = runner.invoke(cli, ["deps", flag, "--json"])
             assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
             data = extract_json_from_output(result.output)
-            # npm packages should be populated
-            assert "npm_packages" in data
-            assert len(data["npm_packages"]) > 0
-            # Python and system should be empty (not checked)
-            assert data["python_packages"] == []
-            assert data["system_tools"] == []
+            # The requested category should be populated
+            assert kept in data
+            assert len(data[kept]) > 0
+            # The other categories should be empty (not checked)
+            for category in _CATEGORIES - {kept}:
+                assert data[category] == []
 
 
 class TestDepsJsonOutput:
     """Tests for deps command JSON output format."""
 
-    def test_deps_json_output_is_valid_json(
-        self, runner: CliRunner, mock_report_all_ok: DependencyReport
-    ) -> None:
+    def test_deps_json_output_is_valid_json(self, deps_json_output: dict) -> None:
         """deps --json outputs valid JSON."""
-        with patch(
-            "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=mock_report_all_ok,
-        ):
-            result = runner.invoke(cli, ["deps", "--json"])
-            assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
-            # Should parse as valid JSON without exception (handles rich formatting)
-            data = extract_json_from_output(result.output)
-            assert isinstance(data, dict)
+        # Parsed without exception by the fixture (handles rich formatting)
+        assert isinstance(deps_json_output, dict)
 
     def test_deps_json_output_contains_expected_keys(
-        self, runner: CliRunner, mock_report_all_ok: DependencyReport
+        self, deps_json_output: dict
     ) -> None:
         """deps --json output contains all expected top-level keys."""
-        with patch(
-            "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=mock_report_all_ok,
-        ):
-            result = runner.invoke(cli, ["deps", "--json"])
-            assert result.exit_code == 0
-            data = extract_json_from_output(result.output)
-            # Check all expected keys present
-            assert "all_required_ok" in data
-            assert "all_ok" in data
-            assert "python_packages" in data
-            assert "system_tools" in data
-            assert "npm_packages" in data
-            # Check package structure has expected fields
-            assert len(data["python_packages"]) > 0
-            pkg = data["python_packages"][0]
-            assert "name" in pkg
-            assert "status" in pkg
-            assert "required" in pkg
-            assert "version" in pkg
+        data = deps_json_output
+        # Check all expected keys present
+        assert "all_required_ok" in data
+        assert "all_ok" in data
+        assert "python_packages" in data
+        assert "system_tools" in data
+        assert "npm_packages" in data
+        # Check package structure has expected fields
+        assert len(data["python_packages"]) > 0
+        pkg = data["python_packages"][0]
+        assert "name" in pkg
+        assert "status" in pkg
+        assert "required" in pkg
+        assert "version" in pkg
 
 
 class TestDepsStrictMode:
     """Tests for deps command --strict mode exit codes."""
 
-    def test_deps_strict_exits_zero_when_all_required_ok(
-        self, runner: CliRunner, mock_report_all_ok: DependencyReport
-    ) -> None:
-        """deps --strict exits 0 when all required dependencies are satisfied."""
-        with patch(
-            "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=mock_report_all_ok,
-        ):
-            result = runner.invoke(cli, ["deps", "--strict"])
-            assert result.exit_code == 0
-
-    def test_deps_strict_exits_one_when_required_missing(
-        self, runner: CliRunner, mock_report_missing_required: DependencyReport
-    ) -> None:
-        """deps --strict exits 1 when required dependencies are missing."""
-        with patch(
-            "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=mock_report_missing_required,
-        ):
-            result = runner.invoke(cli, ["deps", "--strict"])
-            assert result.exit_code == 1
-
-    def test_deps_strict_exits_two_when_only_optional_missing(
-        self, runner: CliRunner, mock_report_missing_optional: DependencyReport
+    @pytest.mark.parametrize(
+        ("report_fixture", "expected_exit"),
+        [
+            # All required dependencies satisfied
+            ("mock_report_all_ok", 0),
+            # Required dependencies missing
+            ("mock_report_missing_required", 1),
+            # Only optional dependencies missing
+            ("mock_report_missing_optional", 2),
+        ],
+    )
+    def test_deps_strict_exit_codes(
+        self,
+        runner: CliRunner,
+        request: pytest.FixtureRequest,
+        report_fixture: str,
+        expected_exit: int,
     ) -> None:
-        """deps --strict exits 2 when only optional dependencies are missing."""
+        """deps --strict exits 0, 1 or 2 depending on what is missing."""
+        report = request.getfixturevalue(report_fixture)
         with patch(
             "svg_text2path.cli.commands.deps.verify_all_dependencies",
-            return_value=mock_report_missing_optional,
+            return_value=report,
         ):
             result = runner.invoke(cli, ["deps", "--strict"])
-            assert result.exit_code == 2
+            assert result.exit_code == expected_exit
 
 
 class TestDepsMissingDependencyDetection:
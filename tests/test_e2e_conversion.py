@@ -24,15 +24,25 @@ Known Issues:
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import itertools
 import json
 import os
+import re
 import shutil
 import subprocess
+import tempfile
+import time
 from pathlib import Path
 from typing import NamedTuple
 
 import pytest
 
+from svg_text2path.api import Text2PathConverter
+from svg_text2path.fonts.cache import FontCache
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 SAMPLES_DIR = PROJECT_ROOT / "samples"
@@ -49,40 +59,48 @@ class ComparisonResult(NamedTuple):
     diff_image: str | None
 
 
+@functools.lru_cache(maxsize=1)
 def is_github_ci() -> bool:
     """Check if running on GitHub CI."""
     return os.environ.get("GITHUB_ACTIONS") == "true" or os.environ.get("CI") == "true"
 
 
+@functools.lru_cache(maxsize=1)
 def has_sbb_compare() -> bool:
-    """Check if sbb-compare is available."""
-    try:
-        result = subprocess.run(
-            ["sbb-compare", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        # Try with npx
-        try:
-            result = subprocess.run(
-                ["npx", "sbb-compare", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
-
-
-def get_sbb_command() -> list[str]:
-    """Get the appropriate sbb-compare command."""
+    """Check if sbb-compare is available, without spawning it.
+
+    It is usable when it is on PATH, or when npx can resolve the project's
+    local svg-bbox install without downloading anything.
+    """
+    if shutil.which("sbb-compare"):
+        return True
+    local_bin = PROJECT_ROOT / "node_modules" / ".bin" / "sbb-compare"
+    return shutil.which("npx") is not None and local_bin.exists()
+
+
+@functools.lru_cache(maxsize=1)
+def get_sbb_command() -> tuple[str, ...]:
+    """Get the appropriate sbb-compare command (cached, so returned as a tuple)."""
     if shutil.which("sbb-compare"):
-        return ["sbb-compare"]
-    return ["npx", "sbb-compare"]
+        return ("sbb-compare",)
+    return ("npx", "sbb-compare")
+
+
+# Options appended to every sbb-compare invocation
+_SBB_CMD_SUFFIX = ("--json", "--headless")
+
+# Child environment for sbb-compare, built once: colors and terminal styling
+# are switched off so its output is plain text and JSON
+_SUBPROCESS_ENV = {**os.environ, "NO_COLOR": "1", "TERM": "dumb"}
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying instead when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device or a filesystem without hardlinks
+        shutil.copy(src, dst)
 
 
 def run_sbb_compare(svg1: Path, svg2: Path) -> ComparisonResult | None:
@@ -95,36 +113,34 @@ def run_sbb_compare(svg1: Path, svg2: Path) -> ComparisonResult | None:
     Returns:
         ComparisonResult or None if comparison failed
     """
-    import uuid
-
-    # Copy files to project root with unique names (sbb-compare security restriction)
-    unique_id = uuid.uuid4().hex[:8]
-    local_svg1 = PROJECT_ROOT / f"_test_{unique_id}_{svg1.name}"
-    local_svg2 = PROJECT_ROOT / f"_test_{unique_id}_{svg2.name}"
+    # sbb-compare only reads files under its working directory, and npx must
+    # still find the project's node_modules, so work in a private directory
+    # inside the project root and link the inputs there rather than copying
+    workdir = Path(tempfile.mkdtemp(prefix="_test_", dir=PROJECT_ROOT))
+    local_svg1 = workdir / f"1_{svg1.name}"
+    local_svg2 = workdir / f"2_{svg2.name}"
 
     try:
-        shutil.copy(svg1, local_svg1)
-        shutil.copy(svg2, local_svg2)
+        _link_or_copy(svg1, local_svg1)
+        _link_or_copy(svg2, local_svg2)
 
-        cmd = get_sbb_command() + [
-            str(local_svg1.name),
-            str(local_svg2.name),
-            "--json",
-            "--headless",
-        ]
+        cmd = [*get_sbb_command(), local_svg1.name, local_svg2.name, *_SBB_CMD_SUFFIX]
 
+        # Keep stdout as bytes: json.loads accepts them, so the JSON path
+        # never decodes the whole buffer to str
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=120,
-            cwd=PROJECT_ROOT,
+            cwd=workdir,
+            env=_SUBPROCESS_ENV,
         )
 
         # Parse JSON output
-        if result.stdout.strip():
+        stdout = result.stdout
+        if stdout and not stdout.isspace():
             try:
-                data = json.loads(result.stdout)
+                data = json.loads(stdout)
                 return ComparisonResult(
                     svg1=str(svg1),
                     svg2=str(svg2),
@@ -133,12 +149,16 @@ def run_sbb_compare(svg1: Path, svg2: Path) -> ComparisonResult | None:
                     diff_percent=data.get("diffPercentage", 100.0),
                     diff_image=data.get("diffImage"),
                 )
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 pass
 
-        # Fallback: parse text output
-        for line in result.stdout.splitlines() + result.stderr.splitlines():
-            if "Difference:" in line and "%" in line:
+        # Fallback: scan the raw output line by line without joining the two
+        # streams, decoding only the line that carries the percentage
+        for raw_line in itertools.chain(
+            result.stdout.splitlines(), result.stderr.splitlines()
+        ):
+            if b"Difference:" in raw_line and b"%" in raw_line:
+                line = raw_line.decode("utf-8", "replace")
                 try:
                     pct = float(line.split(":")[1].strip().rstrip("%"))
                     return ComparisonResult(
@@ -157,93 +177,343 @@ def run_sbb_compare(svg1: Path, svg2: Path) -> ComparisonResult | None:
     except FileNotFoundError:
         return None
     finally:
-        # Cleanup temp files
-        local_svg1.unlink(missing_ok=True)
-        local_svg2.unlink(missing_ok=True)
+        # Cleanup the working directory and anything sbb-compare left in it
+        shutil.rmtree(workdir, ignore_errors=True)
 
     return None
 
 
-# Skip conditions
-skip_on_ci = pytest.mark.skipif(is_github_ci(), reason="E2E tests skip on GitHub CI")
-requires_sbb = pytest.mark.skipif(
-    not has_sbb_compare(), reason="sbb-compare not available"
+# Successful comparisons keyed on the digests of both inputs, so identical
+# document pairs are rendered and diffed once per session
+_compare_cache: dict[tuple[bytes, bytes], ComparisonResult] = {}
+
+
+def _file_digest(path: Path) -> bytes:
+    """Return a short blake2b digest of a file's contents."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+
+
+def _cached_compare(svg1: Path, svg2: Path) -> ComparisonResult | None:
+    """Run sbb-compare through a content-keyed cache.
+
+    Failed comparisons are not cached, so a transient failure is retried.
+    """
+    key = (_file_digest(svg1), _file_digest(svg2))
+    cached = _compare_cache.get(key)
+    if cached is not None:
+        return cached._replace(svg1=str(svg1), svg2=str(svg2))
+    result = run_sbb_compare(svg1, svg2)
+    if result is not None:
+        _compare_cache[key] = result
+    return result
+
+
+# Skip conditions; every sbb-backed class also skips on CI, so the sbb probe is
+# not run there at all (skip_on_ci sits closest to each class so that its
+# reason is the one reported)
+_IN_CI = is_github_ci()
+_HAS_SBB = not _IN_CI and has_sbb_compare()
+skip_on_ci = pytest.mark.skipif(_IN_CI, reason="E2E tests skip on GitHub CI")
+requires_sbb = pytest.mark.skipif(not _HAS_SBB, reason="sbb-compare not available")
+
+# Visual checks already covered by cheaper structural assertions are opt-in:
+# T2P_VISUAL=1 pytest -m visual
+_RUN_VISUAL = os.environ.get("T2P_VISUAL") == "1"
+opt_in_visual = pytest.mark.skipif(not _RUN_VISUAL, reason="set T2P_VISUAL=1 to run")
+
+# The converter emits one <path> per <text> element
+_PATH_TAG_RE = re.compile(rb"<path\b")
+_TEXT_TAG_RE = re.compile(rb"<text\b")
+
+
+def _count_tags(svg: Path) -> tuple[int, int]:
+    """Return the number of <path> and <text> elements in an SVG file."""
+    data = svg.read_bytes()
+    return len(_PATH_TAG_RE.findall(data)), len(_TEXT_TAG_RE.findall(data))
+
+
+# =============================================================================
+# Test documents, built once at import
+# =============================================================================
+
+_SVG_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">
+  <rect width="100%" height="100%" fill="white"/>
+{body}
+</svg>"""
+
+
+def _svg(w: int, h: int, *body: str) -> str:
+    """Build a w x h document on a white backdrop from indented body lines."""
+    return _SVG_TEMPLATE.format(w=w, h=h, body="\n".join(body))
+
+
+_SVG_API_BASIC = _svg(
+    300,
+    80,
+    '  <text x="10" y="50" font-family="Helvetica" font-size="28" fill="black">'
+    "Test Text</text>",
 )
 
+_SVG_STRING_API = _svg(
+    250,
+    60,
+    '  <text x="10" y="40" font-family="Arial" font-size="24" fill="navy">'
+    "String API</text>",
+)
 
-@pytest.fixture
+_SVG_WEIGHTS = _svg(
+    300,
+    200,
+    '  <text x="10" y="40" font-family="Helvetica" font-size="20" '
+    'font-weight="300">Light</text>',
+    '  <text x="10" y="80" font-family="Helvetica" font-size="20" '
+    'font-weight="400">Regular</text>',
+    '  <text x="10" y="120" font-family="Helvetica" font-size="20" '
+    'font-weight="700">Bold</text>',
+    '  <text x="10" y="160" font-family="Helvetica" font-size="20" '
+    'font-weight="900">Black</text>',
+)
+
+_SVG_TSPAN = _svg(
+    400,
+    80,
+    '  <text x="10" y="50" font-family="Helvetica" font-size="24" fill="black">'
+    "<tspan>First </tspan><tspan>Second </tspan><tspan>Third</tspan></text>",
+)
+
+_SVG_TRANSFORMS = _svg(
+    400,
+    200,
+    '  <text x="50" y="50" font-family="Helvetica" font-size="24"',
+    '        transform="rotate(15)">Rotated</text>',
+    '  <text x="50" y="120" font-family="Helvetica" font-size="24"',
+    '        transform="scale(1.2)">Scaled</text>',
+    '  <g transform="translate(100, 50)">',
+    '    <text x="0" y="80" font-family="Helvetica" font-size="24">In Group</text>',
+    "  </g>",
+)
+
+# Every family and weight the pipeline tests use, converted once per class
+_SVG_WARMUP = _svg(
+    300,
+    120,
+    *(
+        f'  <text x="10" y="{20 * (i + 1)}" font-family="Helvetica" '
+        f'font-size="20" font-weight="{weight}">Aa</text>'
+        for i, weight in enumerate((300, 400, 700, 900))
+    ),
+    '  <text x="10" y="100" font-family="Arial" font-size="20">Aa</text>',
+)
+
+_SVG_FRESH_CACHE = _svg(
+    200,
+    60,
+    '  <text x="10" y="40" font-family="Helvetica" font-size="24">Fresh Cache</text>',
+)
+
+_SVG_FALLBACK = _svg(
+    250,
+    60,
+    '  <text x="10" y="40" font-family="Arial" font-size="24">Fallback</text>',
+)
+
+_SVG_CACHE_FIRST = _svg(
+    200,
+    60,
+    '  <text x="10" y="40" font-family="Helvetica" font-size="24">First</text>',
+)
+
+_SVG_CACHE_SECOND = _svg(
+    200,
+    60,
+    '  <text x="10" y="40" font-family="Helvetica" font-size="24">Second</text>',
+)
+
+_SVG_EMPTY_TEXT = _svg(
+    200,
+    60,
+    '  <text x="10" y="40" font-family="Helvetica" font-size="24"></text>',
+    '  <text x="10" y="40" font-family="Helvetica" font-size="24">Real Text</text>',
+)
+
+_SVG_SPECIAL_CHARS = _svg(
+    400,
+    80,
+    '  <text x="10" y="50" font-family="Helvetica" font-size="24">'
+    '&amp; &lt; &gt; "quotes"</text>',
+)
+
+_SVG_UNICODE = _svg(
+    400,
+    80,
+    '  <text x="10" y="50" font-family="Arial Unicode MS, Arial" font-size="24">'
+    "Hello 世界 مرحبا</text>",
+)
+
+_SVG_NO_TEXT = _svg(
+    200,
+    100,
+    '  <circle cx="100" cy="50" r="40" fill="blue"/>',
+)
+
+# Twenty stacked lines of Helvetica text
+_SVG_MANY = _svg(
+    500,
+    550,
+    *(
+        f'  <text x="10" y="{30 + i * 25}" font-family="Helvetica" '
+        f'font-size="18">Line {i + 1}: Sample text content</text>'
+        for i in range(20)
+    ),
+)
+
+# The documents pre-encoded, so tests write them without a text codec
+_SVG_API_BASIC_BYTES = _SVG_API_BASIC.encode("utf-8")
+_SVG_STRING_API_BYTES = _SVG_STRING_API.encode("utf-8")
+_SVG_WEIGHTS_BYTES = _SVG_WEIGHTS.encode("utf-8")
+_SVG_TSPAN_BYTES = _SVG_TSPAN.encode("utf-8")
+_SVG_TRANSFORMS_BYTES = _SVG_TRANSFORMS.encode("utf-8")
+_SVG_FRESH_CACHE_BYTES = _SVG_FRESH_CACHE.encode("utf-8")
+_SVG_FALLBACK_BYTES = _SVG_FALLBACK.encode("utf-8")
+_SVG_CACHE_FIRST_BYTES = _SVG_CACHE_FIRST.encode("utf-8")
+_SVG_CACHE_SECOND_BYTES = _SVG_CACHE_SECOND.encode("utf-8")
+_SVG_EMPTY_TEXT_BYTES = _SVG_EMPTY_TEXT.encode("utf-8")
+_SVG_SPECIAL_CHARS_BYTES = _SVG_SPECIAL_CHARS.encode("utf-8")
+_SVG_UNICODE_BYTES = _SVG_UNICODE.encode("utf-8")
+_SVG_NO_TEXT_BYTES = _SVG_NO_TEXT.encode("utf-8")
+_SVG_MANY_BYTES = _SVG_MANY.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
 def font_cache():
-    """Pre-warmed font cache for conversions."""
-    from svg_text2path.fonts.cache import FontCache
+    """Pre-warmed font cache for conversions, shared by the whole session.
 
+    Prewarming scans the system fonts, so it runs once. Tests must not mutate
+    this cache; the cache integration tests derive private copies of it.
+    """
     cache = FontCache()
     cache.prewarm()
     return cache
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def converter(font_cache):
-    """Text2Path converter with pre-warmed cache."""
-    from svg_text2path.api import Text2PathConverter
+    """Text2Path converter with pre-warmed cache, shared by the whole session.
 
+    The converter resets its textPath map for every document and otherwise
+    only memoizes HarfBuzz fonts, so tests can share one instance. Under
+    pytest-xdist each worker builds its own.
+    """
     return Text2PathConverter(font_cache=font_cache)
 
 
+@functools.lru_cache(maxsize=64)
+def _convert_string_cached(converter: Text2PathConverter, svg: str) -> str:
+    """Convert an SVG string, memoized per converter and document."""
+    return converter.convert_string(svg)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _clear_convert_string_cache():
+    """Drop memoized conversions, and the converters they hold, at session end."""
+    yield
+    _convert_string_cached.cache_clear()
+
+
+@pytest.fixture(scope="class")
+def _warm_fonts(converter):
+    """Load the pipeline tests' fonts once so no test pays for the first parse."""
+    converter.convert_string(_SVG_WARMUP)
+
+
+@pytest.fixture(scope="class")
+def _requires_helvetica(font_cache):
+    """Skip the class when Helvetica, used by its documents, cannot be resolved."""
+    if font_cache.get_font("Helvetica") is None:
+        pytest.skip("Helvetica not installed")
+
+
+@pytest.fixture(scope="class")
+def work_dir(tmp_path_factory) -> Path:
+    """Scratch directory shared by the tests of one class.
+
+    Each test writes its own distinctly named files, so one directory per
+    class replaces a fresh tmp_path per test.
+    """
+    return tmp_path_factory.mktemp("e2e")
+
+
+# Per-instance containers of FontCache that tests may mutate
+_FONT_CACHE_CONTAINERS = frozenset({"_fonts", "_coverage_cache", "_corrupted_fonts"})
+# State memoized on the instance by prewarm() (scanned font index and cache
+# file location); the copy shares it read-only
+_FONT_CACHE_SHARED = frozenset(
+    {"_fc_cache", "_prebaked", "_cache_partial", "_cache_file"}
+)
+
+
+def _fresh_cache_from(prewarmed: FontCache) -> FontCache:
+    """Return a copy of a prewarmed FontCache with private containers.
+
+    copy.copy carries every attribute over, so the copy shares the memoized
+    font index and skips the system scan. The mutable containers are then
+    duplicated so changes to the copy never reach the shared fixture.
+    """
+    cache = copy.copy(prewarmed)
+    unknown = set(vars(cache)) - _FONT_CACHE_CONTAINERS - _FONT_CACHE_SHARED
+    assert not unknown, f"FontCache has unhandled instance state: {unknown}"
+    for name in _FONT_CACHE_CONTAINERS:
+        setattr(cache, name, copy.copy(getattr(prewarmed, name)))
+    return cache
+
+
 # =============================================================================
 # E2E Conversion Tests with Visual Verification
 # =============================================================================
 
 
-@skip_on_ci
 @requires_sbb
+@skip_on_ci
+@pytest.mark.usefixtures("_warm_fonts")
 class TestE2EConversionPipeline:
     """End-to-end tests for complete conversion pipeline."""
 
-    def test_programmatic_api_basic_conversion(self, converter, tmp_path: Path):
+    def test_programmatic_api_basic_conversion(self, converter, work_dir: Path):
         """Test programmatic API produces visually accurate output."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="300" height="80" viewBox="0 0 300 80">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="50" font-family="Helvetica" font-size="28" fill="black">Test Text</text>
-</svg>"""
-        orig_path = tmp_path / "api_orig.svg"
-        conv_path = tmp_path / "api_conv.svg"
+        orig_path = work_dir / "api_orig.svg"
+        conv_path = work_dir / "api_conv.svg"
 
-        orig_path.write_text(svg_content, encoding="utf-8")
+        orig_path.write_bytes(_SVG_API_BASIC_BYTES)
 
         # Use programmatic API
-        result = converter.convert_file(str(orig_path), str(conv_path))
+        result = converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
 
-        # Verify conversion succeeded
+        # Verify conversion succeeded and reported writing the output
         assert result is not None
-        assert conv_path.exists()
+        assert result.output == conv_path
 
         # Verify paths were generated
-        conv_content = conv_path.read_text()
-        assert "<path" in conv_content
-        assert "<text" not in conv_content or "text>" not in conv_content
+        conv_content = conv_path.read_bytes()
+        assert b"<path" in conv_content
+        assert b"<text" not in conv_content or b"text>" not in conv_content
 
         # Visual verification with sbb-compare
-        compare_result = run_sbb_compare(orig_path, conv_path)
+        compare_result = _cached_compare(orig_path, conv_path)
         assert compare_result is not None, "sbb-compare failed"
         assert compare_result.diff_percent < 2.0, (
             f"Visual diff {compare_result.diff_percent:.2f}% exceeds 2% threshold"
         )
 
-    def test_programmatic_api_convert_string(self, converter, tmp_path: Path):
+    def test_programmatic_api_convert_string(self, converter, work_dir: Path):
         """Test convert_string API produces accurate output."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="250" height="60" viewBox="0 0 250 60">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="40" font-family="Arial" font-size="24" fill="navy">String API</text>
-</svg>"""
-        orig_path = tmp_path / "string_orig.svg"
-        conv_path = tmp_path / "string_conv.svg"
+        orig_path = work_dir / "string_orig.svg"
+        conv_path = work_dir / "string_conv.svg"
 
-        orig_path.write_text(svg_content, encoding="utf-8")
+        orig_path.write_bytes(_SVG_STRING_API_BYTES)
 
         # Use convert_string API
-        result = converter.convert_string(svg_content)
+        result = _convert_string_cached(converter, _SVG_STRING_API)
 
         # Write result for comparison
         conv_path.write_text(result, encoding="utf-8")
@@ -252,324 +522,263 @@ class TestE2EConversionPipeline:
         assert "<path" in result
 
         # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
+        compare_result = _cached_compare(orig_path, conv_path)
         assert compare_result is not None, "sbb-compare failed"
         assert compare_result.diff_percent < 2.0, (
             f"Visual diff {compare_result.diff_percent:.2f}% exceeds 2% threshold"
         )
 
-    def test_font_weight_variations(self, converter, tmp_path: Path):
-        """Test font weight variations are accurately converted."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="300" height="200" viewBox="0 0 300 200">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="40" font-family="Helvetica" font-size="20" font-weight="300">Light</text>
-  <text x="10" y="80" font-family="Helvetica" font-size="20" font-weight="400">Regular</text>
-  <text x="10" y="120" font-family="Helvetica" font-size="20" font-weight="700">Bold</text>
-  <text x="10" y="160" font-family="Helvetica" font-size="20" font-weight="900">Black</text>
-</svg>"""
-        orig_path = tmp_path / "weights_orig.svg"
-        conv_path = tmp_path / "weights_conv.svg"
-
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
-
-        # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
+    @pytest.mark.visual
+    @opt_in_visual
+    @pytest.mark.parametrize(
+        ("name", "svg_bytes"),
+        [
+            ("weights", _SVG_WEIGHTS_BYTES),
+            ("tspan", _SVG_TSPAN_BYTES),
+            ("transform", _SVG_TRANSFORMS_BYTES),
+        ],
+        ids=["weights", "tspan", "transform"],
+    )
+    def test_visual_accuracy(
+        self, converter, work_dir: Path, name: str, svg_bytes: bytes
+    ):
+        """Test the structurally checked documents also render accurately."""
+        orig_path = work_dir / f"visual_{name}_orig.svg"
+        conv_path = work_dir / f"visual_{name}_conv.svg"
+
+        orig_path.write_bytes(svg_bytes)
+        converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
+
+        compare_result = _cached_compare(orig_path, conv_path)
         assert compare_result is not None, "sbb-compare failed"
         assert compare_result.diff_percent < 3.0, (
-            f"Font weight diff {compare_result.diff_percent:.2f}% exceeds 3% threshold"
+            f"{name} diff {compare_result.diff_percent:.2f}% exceeds 3% threshold"
         )
 
-    def test_tspan_elements(self, converter, tmp_path: Path):
+
+@skip_on_ci
+@pytest.mark.slow
+@pytest.mark.usefixtures("_requires_helvetica")
+class TestE2EConversionStructure:
+    """Structural checks on converted output that need fonts but not sbb-compare.
+
+    test_visual_accuracy renders the same documents when visual checks are on.
+    """
+
+    def test_font_weight_variations(self, converter, work_dir: Path):
+        """Test font weight variations are accurately converted."""
+        orig_path = work_dir / "weights_orig.svg"
+        conv_path = work_dir / "weights_conv.svg"
+
+        orig_path.write_bytes(_SVG_WEIGHTS_BYTES)
+        result = converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
+        assert result.output == conv_path, f"No output written: {result}"
+
+        # One path per weight, and no text left behind
+        assert _count_tags(conv_path) == (4, 0)
+
+    def test_tspan_elements(self, converter, work_dir: Path):
         """Test tspan elements are accurately converted.
 
         Note: tspans must be on same line to avoid whitespace issues.
         """
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="400" height="80" viewBox="0 0 400 80">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="50" font-family="Helvetica" font-size="24" fill="black"><tspan>First </tspan><tspan>Second </tspan><tspan>Third</tspan></text>
-</svg>"""
-        orig_path = tmp_path / "tspan_orig.svg"
-        conv_path = tmp_path / "tspan_conv.svg"
+        orig_path = work_dir / "tspan_orig.svg"
+        conv_path = work_dir / "tspan_conv.svg"
 
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
+        orig_path.write_bytes(_SVG_TSPAN_BYTES)
+        result = converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
+        assert result.output == conv_path, f"No output written: {result}"
 
-        # Verify tspans were converted
-        conv_content = conv_path.read_text()
-        assert "<path" in conv_content
-
-        # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
-        assert compare_result is not None, "sbb-compare failed"
-        assert compare_result.diff_percent < 3.0, (
-            f"Tspan diff {compare_result.diff_percent:.2f}% exceeds 3% threshold"
-        )
+        # Verify the tspans were merged into their text element's single path
+        assert _count_tags(conv_path) == (1, 0)
 
-    def test_transform_handling(self, converter, tmp_path: Path):
+    def test_transform_handling(self, converter, work_dir: Path):
         """Test text with transforms is accurately converted."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="400" height="200" viewBox="0 0 400 200">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="50" y="50" font-family="Helvetica" font-size="24"
-        transform="rotate(15)">Rotated</text>
-  <text x="50" y="120" font-family="Helvetica" font-size="24"
-        transform="scale(1.2)">Scaled</text>
-  <g transform="translate(100, 50)">
-    <text x="0" y="80" font-family="Helvetica" font-size="24">In Group</text>
-  </g>
-</svg>"""
-        orig_path = tmp_path / "transform_orig.svg"
-        conv_path = tmp_path / "transform_conv.svg"
+        orig_path = work_dir / "transform_orig.svg"
+        conv_path = work_dir / "transform_conv.svg"
 
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
+        orig_path.write_bytes(_SVG_TRANSFORMS_BYTES)
+        result = converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
+        assert result.output == conv_path, f"No output written: {result}"
 
-        # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
-        assert compare_result is not None, "sbb-compare failed"
-        assert compare_result.diff_percent < 3.0, (
-            f"Transform diff {compare_result.diff_percent:.2f}% exceeds 3% threshold"
-        )
+        # Every text element became a path that keeps its own transform
+        assert _count_tags(conv_path) == (3, 0)
+        conv_content = conv_path.read_bytes()
+        assert b"rotate(15)" in conv_content
+        assert b"scale(1.2)" in conv_content
+        assert b"translate(100, 50)" in conv_content
 
 
-@skip_on_ci
 @requires_sbb
+@skip_on_ci
 class TestE2EFontCacheIntegration:
     """E2E tests for font cache integration with corruption detection."""
 
-    def test_fresh_cache_conversion(self, tmp_path: Path):
+    def test_fresh_cache_conversion(self, font_cache, work_dir: Path):
         """Test conversion with fresh font cache (simulates first run)."""
-        from svg_text2path.api import Text2PathConverter
-        from svg_text2path.fonts.cache import FontCache
-
-        # Create fresh cache
-        cache = FontCache()
-        cache.prewarm()
+        cache = _fresh_cache_from(font_cache)
 
         converter = Text2PathConverter(font_cache=cache)
 
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="60" viewBox="0 0 200 60">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="40" font-family="Helvetica" font-size="24">Fresh Cache</text>
-</svg>"""
-        orig_path = tmp_path / "fresh_orig.svg"
-        conv_path = tmp_path / "fresh_conv.svg"
+        orig_path = work_dir / "fresh_orig.svg"
+        conv_path = work_dir / "fresh_conv.svg"
 
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
+        orig_path.write_bytes(_SVG_FRESH_CACHE_BYTES)
+        converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
 
         # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
+        compare_result = _cached_compare(orig_path, conv_path)
         assert compare_result is not None, "sbb-compare failed"
         assert compare_result.diff_percent < 2.0
 
-    def test_corrupted_font_fallback(self, tmp_path: Path):
+    def test_corrupted_font_fallback(self, font_cache, work_dir: Path):
         """Test that corrupted fonts are skipped and fallback works."""
-        from svg_text2path.api import Text2PathConverter
-        from svg_text2path.fonts.cache import FontCache
-
-        # Create cache and mark a non-existent font as corrupted
-        cache = FontCache()
+        # Derive a private cache and mark a non-existent font as corrupted
+        cache = _fresh_cache_from(font_cache)
         cache._corrupted_fonts.add(("/fake/path/corrupted.ttf", 0))
-        cache.prewarm()
 
         converter = Text2PathConverter(font_cache=cache)
 
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="250" height="60" viewBox="0 0 250 60">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="40" font-family="Arial" font-size="24">Fallback Test</text>
-</svg>"""
-        orig_path = tmp_path / "fallback_orig.svg"
-        conv_path = tmp_path / "fallback_conv.svg"
+        orig_path = work_dir / "fallback_orig.svg"
+        conv_path = work_dir / "fallback_conv.svg"
 
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
+        orig_path.write_bytes(_SVG_FALLBACK_BYTES)
+        result = converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
 
         # Conversion should succeed despite corrupted font in list
-        assert conv_path.exists()
-        conv_content = conv_path.read_text()
-        assert "<path" in conv_content
+        assert result.output == conv_path
+        conv_content = conv_path.read_bytes()
+        assert b"<path" in conv_content
 
-        # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
-        assert compare_result is not None, "sbb-compare failed"
-        assert compare_result.diff_percent < 3.0
-
-    def test_cache_reuse_across_conversions(self, tmp_path: Path):
+    def test_cache_reuse_across_conversions(self, font_cache, work_dir: Path):
         """Test that font cache is properly reused across multiple conversions."""
-        from svg_text2path.api import Text2PathConverter
-        from svg_text2path.fonts.cache import FontCache
-
-        cache = FontCache()
-        cache.prewarm()
+        cache = _fresh_cache_from(font_cache)
         converter = Text2PathConverter(font_cache=cache)
 
         # First conversion
-        svg1 = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="60" viewBox="0 0 200 60">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="40" font-family="Helvetica" font-size="24">First</text>
-</svg>"""
-        orig1 = tmp_path / "first_orig.svg"
-        conv1 = tmp_path / "first_conv.svg"
-        orig1.write_text(svg1, encoding="utf-8")
-        converter.convert_file(str(orig1), str(conv1))
+        orig1 = work_dir / "first_orig.svg"
+        conv1 = work_dir / "first_conv.svg"
+        orig1.write_bytes(_SVG_CACHE_FIRST_BYTES)
+        converter.convert_file(os.fspath(orig1), os.fspath(conv1))
 
         # Check cache has entries
         cache_entries_after_first = len(cache._fonts)
 
         # Second conversion with same font
-        svg2 = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="60" viewBox="0 0 200 60">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="40" font-family="Helvetica" font-size="24">Second</text>
-</svg>"""
-        orig2 = tmp_path / "second_orig.svg"
-        conv2 = tmp_path / "second_conv.svg"
-        orig2.write_text(svg2, encoding="utf-8")
-        converter.convert_file(str(orig2), str(conv2))
+        orig2 = work_dir / "second_orig.svg"
+        conv2 = work_dir / "second_conv.svg"
+        orig2.write_bytes(_SVG_CACHE_SECOND_BYTES)
+        converter.convert_file(os.fspath(orig2), os.fspath(conv2))
 
         # Cache should not have grown (font was reused)
         assert len(cache._fonts) == cache_entries_after_first
 
         # Both conversions should be visually accurate
-        result1 = run_sbb_compare(orig1, conv1)
-        result2 = run_sbb_compare(orig2, conv2)
+        result1 = _cached_compare(orig1, conv1)
+        result2 = _cached_compare(orig2, conv2)
 
         assert result1 is not None and result1.diff_percent < 2.0
         assert result2 is not None and result2.diff_percent < 2.0
 
 
-@skip_on_ci
 @requires_sbb
+@skip_on_ci
 class TestE2EEdgeCases:
     """E2E tests for edge cases and error handling."""
 
-    def test_empty_text_element(self, converter, tmp_path: Path):
+    def test_empty_text_element(self, converter, work_dir: Path):
         """Test conversion handles empty text elements gracefully."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="60" viewBox="0 0 200 60">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="40" font-family="Helvetica" font-size="24"></text>
-  <text x="10" y="40" font-family="Helvetica" font-size="24">Real Text</text>
-</svg>"""
-        orig_path = tmp_path / "empty_orig.svg"
-        conv_path = tmp_path / "empty_conv.svg"
+        orig_path = work_dir / "empty_orig.svg"
+        conv_path = work_dir / "empty_conv.svg"
 
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
+        orig_path.write_bytes(_SVG_EMPTY_TEXT_BYTES)
+        result = converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
 
-        # Should succeed
-        assert conv_path.exists()
+        # Should succeed and write the output
+        assert result.output == conv_path
 
         # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
+        compare_result = _cached_compare(orig_path, conv_path)
         assert compare_result is not None
         assert compare_result.diff_percent < 2.0
 
-    def test_special_characters(self, converter, tmp_path: Path):
-        """Test conversion handles special characters correctly."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="400" height="80" viewBox="0 0 400 80">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="50" font-family="Helvetica" font-size="24">&amp; &lt; &gt; "quotes"</text>
-</svg>"""
-        orig_path = tmp_path / "special_orig.svg"
-        conv_path = tmp_path / "special_conv.svg"
-
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
-
-        # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
-        assert compare_result is not None
-        assert compare_result.diff_percent < 3.0
-
-    def test_unicode_text(self, converter, tmp_path: Path):
-        """Test conversion handles Unicode text correctly."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="400" height="80" viewBox="0 0 400 80">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="10" y="50" font-family="Arial Unicode MS, Arial" font-size="24">Hello 世界 مرحبا</text>
-</svg>"""
-        orig_path = tmp_path / "unicode_orig.svg"
-        conv_path = tmp_path / "unicode_conv.svg"
-
-        orig_path.write_text(svg_content, encoding="utf-8")
-
-        # This may fail if fonts don't support the characters, which is expected
+    @pytest.mark.parametrize(
+        ("name", "svg_bytes", "max_diff", "fonts_optional"),
+        [
+            ("special", _SVG_SPECIAL_CHARS_BYTES, 3.0, False),
+            # Higher threshold for Unicode due to font substitution
+            ("unicode", _SVG_UNICODE_BYTES, 10.0, True),
+        ],
+        ids=["special", "unicode"],
+    )
+    def test_char_payloads(
+        self,
+        converter,
+        work_dir: Path,
+        name: str,
+        svg_bytes: bytes,
+        max_diff: float,
+        fonts_optional: bool,
+    ):
+        """Test conversion handles escaped and non-Latin characters correctly."""
+        orig_path = work_dir / f"{name}_orig.svg"
+        conv_path = work_dir / f"{name}_conv.svg"
+
+        orig_path.write_bytes(svg_bytes)
+
+        # Unicode conversion may fail if fonts don't support the characters
         try:
-            converter.convert_file(str(orig_path), str(conv_path))
-            if conv_path.exists():
-                compare_result = run_sbb_compare(orig_path, conv_path)
-                # Allow higher threshold for Unicode due to font substitution
-                if compare_result is not None:
-                    assert compare_result.diff_percent < 10.0
+            converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
         except Exception:
-            # Font missing is acceptable for this test
+            if not fonts_optional:
+                raise
             pytest.skip("Unicode fonts not available")
+        if fonts_optional and not conv_path.exists():
+            return
 
-    def test_no_text_elements(self, converter, tmp_path: Path):
-        """Test conversion handles SVG with no text elements."""
-        svg_content = """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="200" height="100" viewBox="0 0 200 100">
-  <rect width="100%" height="100%" fill="white"/>
-  <circle cx="100" cy="50" r="40" fill="blue"/>
-</svg>"""
-        orig_path = tmp_path / "notext_orig.svg"
-        conv_path = tmp_path / "notext_conv.svg"
+        # Visual verification
+        compare_result = _cached_compare(orig_path, conv_path)
+        if compare_result is None and fonts_optional:
+            return
+        assert compare_result is not None
+        assert compare_result.diff_percent < max_diff
 
-        orig_path.write_text(svg_content, encoding="utf-8")
-        converter.convert_file(str(orig_path), str(conv_path))
+    def test_no_text_elements(self, converter, work_dir: Path):
+        """Test conversion handles SVG with no text elements."""
+        orig_path = work_dir / "notext_orig.svg"
+        conv_path = work_dir / "notext_conv.svg"
 
-        # Should succeed (no-op conversion)
-        assert conv_path.exists()
+        orig_path.write_bytes(_SVG_NO_TEXT_BYTES)
+        result = converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
 
-        # Output should be identical to input (no changes needed)
-        compare_result = run_sbb_compare(orig_path, conv_path)
-        assert compare_result is not None
-        assert compare_result.diff_percent < 1.0  # Should be near-identical
+        # Should succeed (no-op conversion) and write the output
+        assert result.output == conv_path
+        assert result.fast_path
+        assert _count_tags(conv_path) == (0, 0)
 
 
-@skip_on_ci
 @requires_sbb
+@skip_on_ci
 class TestE2EPerformance:
     """E2E tests for performance characteristics."""
 
     @pytest.mark.slow
-    def test_multiple_text_elements(self, converter, tmp_path: Path):
+    def test_multiple_text_elements(self, converter, work_dir: Path):
         """Test conversion with many text elements."""
-        # Generate SVG with 20 text elements
-        texts = "\n".join(
-            f'  <text x="10" y="{30 + i * 25}" font-family="Helvetica" '
-            f'font-size="18">Line {i + 1}: Sample text content</text>'
-            for i in range(20)
-        )
-        svg_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="500" height="550" viewBox="0 0 500 550">
-  <rect width="100%" height="100%" fill="white"/>
-{texts}
-</svg>"""
-        orig_path = tmp_path / "many_orig.svg"
-        conv_path = tmp_path / "many_conv.svg"
-
-        orig_path.write_text(svg_content, encoding="utf-8")
+        orig_path = work_dir / "many_orig.svg"
+        conv_path = work_dir / "many_conv.svg"
 
-        import time
+        # SVG with 20 text elements
+        orig_path.write_bytes(_SVG_MANY_BYTES)
 
-        start = time.time()
-        converter.convert_file(str(orig_path), str(conv_path))
-        elapsed = time.time() - start
+        start = time.perf_counter_ns()
+        converter.convert_file(os.fspath(orig_path), os.fspath(conv_path))
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
         # Should complete in reasonable time
-        assert elapsed < 10.0, f"Conversion took {elapsed:.1f}s (> 30s limit)"
+        assert elapsed < 10.0, f"Conversion took {elapsed:.1f}s (> 10s limit)"
 
         # Visual verification
-        compare_result = run_sbb_compare(orig_path, conv_path)
+        compare_result = _cached_compare(orig_path, conv_path)
         assert compare_result is not None
         assert compare_result.diff_percent < 3.0